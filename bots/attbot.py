@@ -10,19 +10,23 @@ from datetime import datetime, timedelta, timezone
 from discord.ext import commands
 from discord.ui import View, Select
 from discord import TextChannel, app_commands, Interaction
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dateutil import parser
 import re
+import contextlib
+import functools
+import io
 import random
-import secrets
 import logging
 import asyncio
 import sqlite3
+import sys
+import time
 
 try:
-    from bots.utils import init_db, get_user_reminders, add_reminder, delete_reminder, get_reminders, add_quote, get_random_quote, get_random_quote_by_user, get_user_quotes, delete_quote, migrate_add_quoted_user
+    from bots.utils import init_db, get_user_reminders, add_reminder, delete_reminder, get_reminders, reminder_exists, add_quote, get_random_quote, get_random_quote_by_user, get_user_quotes, delete_quote, migrate_add_quoted_user
 except ModuleNotFoundError:
-    from utils import init_db, get_user_reminders, add_reminder, delete_reminder, get_reminders, add_quote, get_random_quote, get_random_quote_by_user, get_user_quotes, delete_quote, migrate_add_quoted_user
+    from utils import init_db, get_user_reminders, add_reminder, delete_reminder, get_reminders, reminder_exists, add_quote, get_random_quote, get_random_quote_by_user, get_user_quotes, delete_quote, migrate_add_quoted_user
 
 __version__ = "2.4"
 
@@ -58,11 +62,23 @@ GUILD_ID = _get_required_int_env(GUILD_ID_ENV_VAR)
 if not TOKEN:
     TOKEN = input("Enter your Discord Bot Token: ")
 
+# Precompiled pattern for non-ASCII names in normalize_name, these get hit for every scanned name so don't make the re module look it up on each call
+_PUNCT_RE = re.compile(r"[^\w\s/]")
+
+# str.translate table that drops every ASCII char the punctuation regex would strip (anything not \w, whitespace or '/'),
+# names are nearly always plain ASCII so this skips the regex engine entirely
+_ASCII_PUNCT_TABLE = str.maketrans({
+    chr(c): None for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in "_/" or chr(c).isspace())
+})
+
 
 def is_valid_snowflake(s):
     """Returns True if the input string is a valid Discord snowflake ID."""
 
-    return bool(re.fullmatch(r"\d{17,20}", str(s)))
+    # plain length + ASCII digit check, no need for the regex engine on a fixed 17-20 digit pattern
+    s = str(s)
+    return 17 <= len(s) <= 20 and s.isascii() and s.isdigit()
 
 
 # channel id and snowflake check
@@ -106,35 +122,195 @@ intents.messages = True
 # get the bot commands in a variable with usual/standard prefix
 bot = commands.Bot(command_prefix="/", intents=intents)
 
+# One shared Mersenne Twister for /rand, dice rolls don't need os.urandom on every call like secrets does
+rng = random.Random()
+
 scheduled_reminders: dict[int, asyncio.Task] = {}
 reminders_loaded = False  # prevents duplicate scheduling on reconnection
 
-# In-memory log: pseudo_id -> log entry (persistent memory not really required)
+# In-memory log: pseudo_id (event_id, user_id, response) -> log entry (persistent memory not really required)
 attendance_log = {}
 
+# Role required for the admin/scan commands, see is_nco
+NCO_ROLE_NAME = "NCO"
+
+# Roles whose members are left out of /summary, they aren't expected to respond to events
+SUMMARY_EXCLUDED_ROLES = frozenset({"Guest", "Reserves", "External Unit Rep"})
+
+# NCO role ids per guild: guild id -> ids of every role named NCO (a guild can have more than one), resolved by name in on_ready and kept
+# current by the guild role events, see cache_nco_role_id
+nco_role_ids: dict[int, frozenset[int]] = {}
+
+# Name of the event bot whose posts we scan, checked against msg.author.name. Change this to scan a different bot.
+APOLLO_AUTHOR = "Apollo"
+
+# Apollo's user id, filled in by is_apollo_author the first time scan_apollo_events sees an Apollo post in CHANNEL_ID, reset by /clear_cache
+apollo_author_id: int | None = None
+
 # Holds data for all of  Apollo events
 event_log = []  # Populate this in /scan_apollo command
 
+# Short-lived cache of fetched channel history: channel id -> {"fetched_at", "messages", "complete", "lock"}, see cached_history
+HISTORY_CACHE_TTL = 60  # seconds
+history_cache: dict[int, dict] = {}
+
+# Non-bot members per guild: guild id -> {member id: member}, built on first use and kept up to date by the on_member_* events, see human_members
+member_index: dict[int, dict[int, discord.Member]] = {}
+
+
+def is_nco(member) -> bool:
+    """ Permission check for the admin/scan commands, True if the member has the NCO role. One pass over the member's roles that stops
+        at the first match, shared by every command instead of each one doing its own lookup. """
+
+    # when the member's guild has resolved NCO role ids it's a set lookup per role, otherwise (not resolved yet, or the guild has no role
+    # called NCO right now) fall back to the name
+    guild = getattr(member, "guild", None)
+    role_ids = nco_role_ids.get(guild.id) if guild is not None else None
+    if role_ids is not None:
+        return any(role.id in role_ids for role in member.roles)
+    return any(role.name == NCO_ROLE_NAME for role in member.roles)
+
+
+def cache_nco_role_id(guild):
+    """ Looks up every role called NCO in the guild and keeps their ids in nco_role_ids, or drops the guild's entry if it has none. All of
+        them are kept, not just the first, since the name check this replaces let a member with any role named NCO through.
+        Called for every guild from on_ready, and again for a single guild whenever one of its roles is created, renamed or deleted, so a
+        recreated role is picked up straight away and a role renamed away from NCO stops granting access. """
+
+    role_ids = frozenset(role.id for role in guild.roles if role.name == NCO_ROLE_NAME)
+    if role_ids:
+        nco_role_ids[guild.id] = role_ids
+    else:
+        nco_role_ids.pop(guild.id, None)
+
+
+def cache_nco_role_ids():
+    """ Resolves the NCO role ids of every guild the bot is in, see cache_nco_role_id. """
+
+    nco_role_ids.clear()
+    for guild in bot.guilds:
+        cache_nco_role_id(guild)
+
+
+def is_apollo_author(author, pin: bool = False) -> bool:
+    """ True if the message author is the Apollo bot. Until Apollo's id is known this matches bot accounts with APOLLO_AUTHOR in their name,
+        and once pinned every message after that is a plain int compare instead of a substring search. Requiring a bot account also keeps
+        a member who happens to have 'Apollo' in their name from being scanned as an event.
+        - Only pass pin=True from the scan of the configured CHANNEL_ID. The debug commands scan whatever channel they're run in, and some
+          other bot with 'Apollo' in its name (e.g. 'Apollo Music') must not get pinned there and hide the real Apollo from every scan.
+        - Even with pin=True only a bot named exactly APOLLO_AUTHOR gets pinned, a look-alike ('Apollo Helper', a test bot) still matches
+          through the substring check but never takes the pin. """
+
+    global apollo_author_id
+
+    if apollo_author_id is not None:
+        return author.id == apollo_author_id
+
+    if APOLLO_AUTHOR not in author.name or not author.bot:
+        return False
+    if pin and author.name == APOLLO_AUTHOR:
+        apollo_author_id = author.id
+    return True
+
+
+def human_members(guild) -> dict[int, discord.Member]:
+    """ Returns the guild's non-bot members keyed by id. The dict is only built the first time a command asks for it, after that the
+        member join/leave/update events keep it current, so commands don't have to walk and filter guild.members on every call. """
+
+    members = member_index.get(guild.id)
+    if members is None:
+        members = member_index[guild.id] = {m.id: m for m in guild.members if not m.bot}
+    return members
+
+
+def chunk_lines(lines, maxlen: int = 1900, sep: str = "\n"):
+    """ Groups lines into `sep`-joined chunks of at most `maxlen` characters, breaking only between lines so markdown like **bold** doesn't
+        get cut in half. A single line that's longer than maxlen on its own is still sliced, there's no other way to make it fit.
+        It's a generator, each chunk is built right when it's asked for. """
+
+    buffer, size = [], 0
+    for line in lines:
+        # + len(sep) for the separator that joins it to the line before it
+        if buffer and size + len(line) + len(sep) > maxlen:
+            yield sep.join(buffer)
+            buffer, size = [], 0
+
+        while len(line) > maxlen:
+            yield line[:maxlen]
+            line = line[maxlen:]
+
+        buffer.append(line)
+        size += len(line) + len(sep)
+
+    if buffer:
+        yield sep.join(buffer)
+
+
+async def send_chunked(interaction: discord.Interaction, message: str, chunk_size: int = 1900, filename: str | None = None):
+    """ Sends a (possibly long) message as followups of at most `chunk_size` characters, because of discord's message char limit.
+        The message is split between lines by chunk_lines, and each chunk is only built when it's about to be sent.
+        - With a filename, an overflowing message goes out as ONE followup instead: the first lines as a preview, and the full text attached
+          as a file, so it costs a single round trip to discord instead of one per chunk. """
+
+    if len(message) <= chunk_size:
+        await interaction.followup.send(message)
+        return
+
+    if filename:
+        preview = message[:chunk_size - 50].rsplit("\n", 1)[0]
+        await interaction.followup.send(
+            f"{preview}\n\n_Full output attached as {filename}_",
+            file=discord.File(io.BytesIO(message.encode("utf-8")), filename=filename)
+        )
+        return
+
+    for chunk in chunk_lines(message.split("\n"), chunk_size):
+        await interaction.followup.send(chunk)
+
 
 # already logged function that removes duplicates
 def already_logged(pseudo_id):
     return pseudo_id in attendance_log
 
 
+def event_member_ids(event: dict, category: str) -> frozenset:
+    """ Returns the member ids that responded to an event as 'accepted' or 'declined'. Uses the '<category>_ids' index that scan_apollo_events
+        stores on each event, and only builds the set from the raw entries for events that don't have one. Those entries can be (id, name)
+        tuples/lists or plain ids, stored as ints or strings, so every id is coerced to int and bad entries are logged and skipped. """
+
+    ids = event.get(f"{category}_ids")
+    if ids is not None:
+        return ids
+
+    uids = set()
+    for entry in event.get(category, []):
+        uid = entry[0] if isinstance(entry, (list, tuple)) and len(entry) > 0 else entry
+        try:
+            uids.add(int(uid))
+        except Exception:
+            logging.exception("Error extracting %s entry in event %s: %r", category, event.get("event_id", "N/A"), entry)
+    return frozenset(uids)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
-    """Using regex, we normalize scanned names to pass into other functions."""
+    """We normalize scanned names to pass into other functions. Cached, since the same members show up across every event."""
 
-    name = name.lower()
+    # casefold rather than lower so unicode nicknames compare properly too (e.g. 'ß' and 'ss' end up the same), for plain ASCII it's identical
+    name = name.casefold().translate(_ASCII_PUNCT_TABLE)
 
     # NOTE: The '/' character is explicitly preserved here to maintain rank formats like MSPC/5, LCPL/3, etc.
     # Previously, '/' was stripped as punctuation which caused MSPC/5 and MSPC/6 to both normalize
     # to 'mspc5' and 'mspc6'- breaking fuzzy matching in resolve_member when a member was promoted.
     # If the server's rank/naming structure changes in the future (e.g. uses '-' or '.' as a separator
-    # instead of '/'), this regex will need to be updated to preserve that character instead.
-    name = re.sub(r"[^\w\s/]", "", name)
+    # instead of '/'), both _ASCII_PUNCT_TABLE and _PUNCT_RE will need to be updated to preserve that character instead.
+    # Only non-ASCII names (emoji, fancy unicode nicknames) still need the regex pass.
+    if not name.isascii():
+        name = _PUNCT_RE.sub("", name)
 
-    name = re.sub(r"\s+", " ", name)  # normalize whitespace
-    return name.strip()
+    # split() with no args collapses whitespace runs and trims both ends in one go. Interned so every spelling that normalizes to the same
+    # name shares one str object, and the lookup dict compares hit the identity fast path
+    return sys.intern(" ".join(name.split()))
 
 
 def schedule_reminder(reminder_id, user_id, channel_id, message, remind_time, dm):
@@ -153,6 +329,16 @@ def schedule_reminder(reminder_id, user_id, channel_id, message, remind_time, dm
     scheduled_reminders[reminder_id] = task
 
 
+@bot.event
+async def setup_hook():
+    """ Runs once before the bot connects, unlike on_ready which fires again on every reconnect. The db setup only has to happen once per
+        process, and it runs in a worker thread so the blocking sqlite calls don't hold up the event loop. """
+
+    # call the init function to get the db
+    await asyncio.to_thread(init_db)
+    await asyncio.to_thread(migrate_add_quoted_user)  # runs after table is guaranteed to exist
+
+
 @bot.event
 async def on_ready():
     """Event syncing function to sync all available commands to the deployment environment."""
@@ -165,14 +351,15 @@ async def on_ready():
     # Debug: Detailed user info (useful for troubleshooting)
     logging.debug(f"Logged in as {bot.user}")
 
-    # call the init function to get the db
-    init_db()
-    migrate_add_quoted_user()  # runs after table is guaranteed to exist
+    # member events can be missed while disconnected, so drop the member index and let it rebuild from the fresh member cache
+    member_index.clear()
+    cache_nco_role_ids()
 
     # Only load reminders ONCE per process lifetime if reminders are not loaded, then for each reminder in the get_reminders utils functions,
     # get that reminder and schedule it, set loaded reminders to True
     if not reminders_loaded:
-        for r in get_reminders():
+        # like every db helper call in here, run it in a worker thread so a slow disk read/write never stalls the event loop
+        for r in await asyncio.to_thread(get_reminders):
             reminder_id, user_id, channel_id, message, remind_time, dm = r
             schedule_reminder(reminder_id, user_id, channel_id, message, remind_time, dm)
         reminders_loaded = True
@@ -188,6 +375,49 @@ async def on_ready():
         logging.error(f"Error syncing commands: {e}")
 
 
+# These keep member_index in step with the guild, they only touch guilds that already have an index, the rest get built on first use anyway
+@bot.event
+async def on_member_join(member):
+    members = member_index.get(member.guild.id)
+    if members is not None and not member.bot:
+        members[member.id] = member
+
+
+@bot.event
+async def on_member_remove(member):
+    members = member_index.get(member.guild.id)
+    if members is not None:
+        members.pop(member.id, None)
+
+
+@bot.event
+async def on_member_update(before, after):
+    members = member_index.get(after.guild.id)
+    if members is not None and not after.bot:
+        members[after.id] = after
+
+
+# These keep nco_role_ids in step with the guild's roles, discord.py has already applied the change to guild.roles when they're called
+@bot.event
+async def on_guild_join(guild):
+    cache_nco_role_id(guild)
+
+
+@bot.event
+async def on_guild_role_create(role):
+    cache_nco_role_id(role.guild)
+
+
+@bot.event
+async def on_guild_role_update(before, after):
+    cache_nco_role_id(after.guild)
+
+
+@bot.event
+async def on_guild_role_delete(role):
+    cache_nco_role_id(role.guild)
+
+
 async def reminder_task(reminder_id, user_id, channel_id, message, remind_time, dm):
     """ function gets a reminder task in iso format and check if there is a dm to be sent to the user to confirm or create a message """
 
@@ -195,7 +425,7 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
     try:
         try:
             if isinstance(remind_time, str):
-                remind_time = parser.isoparse(remind_time)
+                remind_time = datetime.fromisoformat(remind_time)
 
             # If there is no timezone info, replace the existing reminder with the current UTC of the user who made the task
             if remind_time.tzinfo is None:
@@ -205,8 +435,9 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
             logging.error(f"Failed to parse remind_time for reminder {reminder_id}: {e}")
             return
 
-        # Accurate long-term waiting, using this while loop, we continuously check for the time of the reminder to be sent, by finding delta between
-        # time of reminder, and time now.
+        # Accurate long-term waiting, sleep for the whole delta between the time of the reminder and time now in one go, asyncio handles long
+        # sleeps fine so there's no need to wake up every hour. The loop is only there because the event loop's clock and the wall clock can
+        # drift apart a little over a long sleep, if we wake up early we just sleep off what's left instead of the sanity check below dropping it.
         while True:
             now = datetime.now(timezone.utc)
             remaining = (remind_time - now).total_seconds()
@@ -215,13 +446,13 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
                 break
 
             try:
-                await asyncio.sleep(min(remaining, 3600))
+                await asyncio.sleep(remaining)
             except asyncio.CancelledError:
                 logging.info(f"Reminder {reminder_id} cancelled during sleep.")
                 return
 
-        # Make sure reminder still exists, by checking from the index of the get reminders dictionary on top, if not, then stop function
-        if not any(r[0] == reminder_id for r in get_reminders()):
+        # Make sure reminder still exists (it may have been deleted with /myreminders while we slept), if not, then stop function
+        if not await asyncio.to_thread(reminder_exists, reminder_id):
             return
 
         # Final time sanity check
@@ -231,7 +462,8 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
 
         # Get the user.id in a variable, then check if the user opted for a DM or "in-channel reminder", if it was a dm, then send the dm with the message
         # else get the channel_id the command was made in, and send the reminder there.
-        user = await bot.fetch_user(user_id)
+        # the member cache usually has them already, only go to the API for users the bot can't see
+        user = bot.get_user(user_id) or await bot.fetch_user(user_id)
 
         if dm:
             await user.send(f"Reminder: {message}")
@@ -241,7 +473,7 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
                 await channel.send(f"{user.mention} ⏰ Reminder: {message}")
 
         # Once reminder has been executed, call delete reminder function and "cancel.Task" the reminder_id and the users_id from the db
-        delete_reminder(reminder_id, user_id)
+        await asyncio.to_thread(delete_reminder, reminder_id, user_id)
 
     except Exception as e:
         logging.exception(f"Unexpected error in reminder_task {reminder_id}: {e}")
@@ -251,6 +483,22 @@ async def reminder_task(reminder_id, user_id, channel_id, message, remind_time,
         scheduled_reminders.pop(reminder_id, None)
 
 
+def parse_embed_names(text: str, dashed_only: bool = False) -> list[str]:
+    """ Pulls the names out of an Apollo embed field value or description, which lists one member per "- Name" line.
+        With dashed_only, lines that don't start with '-' are skipped (the description also holds non-name text). """
+
+    names = []
+    for line in text.splitlines():
+        line = line.strip()
+        if dashed_only and not line.startswith("-"):
+            continue
+
+        name = line.strip("- ").strip()
+        if name:
+            names.append(name)
+    return names
+
+
 def resolve_member(name: str, display_lookup: dict, username_lookup: dict) -> discord.Member | None:
 
     """ function resolves a members name, by passing in name, display name and username, mapping them to a discord member object and
@@ -282,6 +530,54 @@ def resolve_member(name: str, display_lookup: dict, username_lookup: dict) -> di
     return None
 
 
+async def cached_history(channel, limit: int, key: int):
+    """
+    Wraps channel.history(limit=limit) with a short-lived cache stored under `key`, so back to back scans (e.g. /scan_apollo then /summary)
+        don't page through the same messages over the REST api again.
+        - Messages are cached as they're fetched, so a scan that stops early still caches what it read. If a later scan needs to go further
+          back, the rest is fetched from before the last cached message.
+    """
+
+    now = time.monotonic()
+    entry = history_cache.get(key)
+    if entry is None or now - entry["fetched_at"] >= HISTORY_CACHE_TTL:
+        # the lock makes sure only one scan at a time pages the channel into this entry, two concurrent scans both topping it up from the
+        # same last message would add the same messages twice
+        entry = {"fetched_at": now, "messages": [], "complete": False, "lock": asyncio.Lock()}
+        history_cache[key] = entry
+
+    messages = entry["messages"]
+    served = 0
+    while served < min(len(messages), limit):
+        yield messages[served]
+        served += 1
+
+    if entry["complete"] or served >= limit:
+        return
+
+    async with entry["lock"]:
+        # another scan may have added to the cache while we were waiting on the lock, serve that first instead of fetching it again
+        while served < min(len(messages), limit):
+            yield messages[served]
+            served += 1
+
+        if entry["complete"] or served >= limit:
+            return
+
+        # ran out of cached messages, carry on from where the cache stops
+        remaining = limit - served
+        if messages:
+            history = channel.history(limit=remaining, before=messages[-1])
+        else:
+            history = channel.history(limit=remaining)
+
+        async for msg in history:
+            messages.append(msg)
+            yield msg
+
+        entry["complete"] = True
+
+
 async def scan_apollo_events(limit: int | None = None) -> tuple[int, int]:
     """
     Scans the channel history to collect exactly `limit` Apollo events.
@@ -325,81 +621,90 @@ async def scan_apollo_events(limit: int | None = None) -> tuple[int, int]:
 
     apollo_events_collected = 0
 
-    async for msg in target_channel.history(limit=max_to_scan):
-        scanned_messages += 1
+    # The same raw embed names show up in every event, so resolve each one once per scan and reuse the result,
+    # a miss in resolve_member falls through to a fuzzy scan over every member which we don't want to repeat
+    resolved_names: dict[str, discord.Member | None] = {}
 
-        # Only count Apollo bot messages (NOTE this can be changed with a simple variable to store the bot string to make it more robust and specific,
-        # but it's of no real use to me)
-        if "Apollo" not in msg.author.name:
-            continue
+    def resolve(name: str) -> discord.Member | None:
+        if name not in resolved_names:
+            resolved_names[name] = resolve_member(name, member_lookup_display, member_lookup_username)
+        return resolved_names[name]
 
-        apollo_events_collected += 1
+    # aclosing so that when we stop early, cached_history is closed (and lets go of the cache entry's lock) right away, not whenever the
+    # abandoned generator gets garbage collected
+    async with contextlib.aclosing(cached_history(target_channel, max_to_scan, key=int(CHANNEL_ID))) as history:
+        async for msg in history:
+            scanned_messages += 1
 
-        attendees, declined = [], []
+            # Only count Apollo bot messages (NOTE the bot string lives in APOLLO_AUTHOR, change that to scan a different bot)
+            if not is_apollo_author(msg.author, pin=True):
+                continue
 
-        for embed in msg.embeds:
+            apollo_events_collected += 1
 
-            # Accepted
-            for field in embed.fields:
-                if "accepted" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
+            attendees, declined = [], []
 
-                # Declined or ❌
-                if "declined" in field.name.lower() or "x" in field.name.lower():
-                    for line in field.value.split("\n"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            declined.append(name)
+            for embed in msg.embeds:
 
-            # Fallback: attendees in description
-            if embed.description:
-                for line in embed.description.split("\n"):
-                    if line.strip().startswith("-"):
-                        name = line.strip("- ").strip()
-                        if name:
-                            attendees.append(name)
+                # single pass over the fields, lowercase the field name once and route its lines to accepted OR declined
+                for field in embed.fields:
+                    field_name = field.name.lower()
+
+                    # Accepted
+                    if "accepted" in field_name:
+                        attendees.extend(parse_embed_names(field.value))
+
+                    # Declined or ❌
+                    elif "declined" in field_name or "x" in field_name:
+                        declined.extend(parse_embed_names(field.value))
+
+                # Fallback: attendees in description
+                if embed.description:
+                    attendees.extend(parse_embed_names(embed.description, dashed_only=True))
+
+            # Normalize names and store them in a list, previously I was using display names, and I thought apollo did that as well. 
+            # Now, build member lookup from the actual guild id set earlier in this function, resolve embed names to real member.id,
+            # and now hopefully normalized strings are not stored as IDs
+            # A member listed in both an accepted field and the description fallback shows up twice, dedupe (keeping order) before resolving
+            attendees = list(dict.fromkeys(attendees))
+            declined = list(dict.fromkeys(declined))
+
+            # the pretty name stored with each id is the member's display name, stripped here once so the leaderboard and award lines
+            # can show it as is
+            resolved_attendees = []
+            for name in attendees:
+                member = resolve(name)
+                if member:
+                    resolved_attendees.append((member.id, member.display_name.strip()))
+
+            resolved_declined = []
+            for name in declined:
+                member = resolve(name)
+                if member:
+                    resolved_declined.append((member.id, member.display_name.strip()))
+
+            # Log the event, the *_ids frozensets are a precomputed index so check_member can do O(1) lookups per event
+            event_log.append({
+                "event_id": msg.id,
+                "accepted": resolved_attendees,
+                "declined": resolved_declined,
+                "accepted_ids": frozenset(user_id for user_id, _ in resolved_attendees),
+                "declined_ids": frozenset(user_id for user_id, _ in resolved_declined),
+            })
 
-        # Normalize names and store them in a list, previously I was using display names, and I thought apollo did that as well. 
-        # Now, build member lookup from the actual guild id set earlier in this function, resolve embed names to real member.id,
-        # and now hopefully normalized strings are not stored as IDs
-        resolved_attendees = []
-        for name in attendees:
-            member = resolve_member(name, member_lookup_display, member_lookup_username)
-            if member:
-                resolved_attendees.append((member.id, member.display_name))
-
-        resolved_declined = []
-        for name in declined:
-            member = resolve_member(name, member_lookup_display, member_lookup_username)
-            if member:
-                resolved_declined.append((member.id, member.display_name))
-
-        # Log the event
-        event_log.append({
-            "event_id": msg.id,
-            "accepted": resolved_attendees,
-            "declined": resolved_declined
-        })
-
-        # TODO: Check if pretty names vs user_id is actually correct and add logging message, for both apollo collection and for users who reacted
-        for user_id, pretty in resolved_attendees:
-            pseudo_id = f"{msg.id}-{user_id}"
-            if not already_logged(pseudo_id):
-                log_attendance(user_id, pretty, msg.id)
-                logged += 1
-
-        for user_id, pretty in resolved_declined:
-            pseudo_id = f"{msg.id}-{user_id}-declined"
-            if not already_logged(pseudo_id):
-                log_attendance(user_id, pretty, msg.id, response="declined")
-                logged += 1
-
-        # Stop early if we've collected enough Apollo events
-        if limit and apollo_events_collected >= limit:
-            break
+            # TODO: Check if pretty names vs user_id is actually correct and add logging message, for both apollo collection and for users who reacted
+            # log_attendance does the duplicate check itself and tells us if the entry was new
+            for user_id, pretty in resolved_attendees:
+                if log_attendance(user_id, pretty, msg.id):
+                    logged += 1
+
+            for user_id, pretty in resolved_declined:
+                if log_attendance(user_id, pretty, msg.id, response="declined"):
+                    logged += 1
+
+            # Stop early if we've collected enough Apollo events
+            if limit and apollo_events_collected >= limit:
+                break
 
     return (scanned_messages, logged)
 
@@ -409,26 +714,29 @@ def log_attendance(user_id, username, event_id, response="accepted"):
     Logs all users who have accepted. I.e., this function allows you to target any specific embed string and capture that response as a formatted
         data structure.
         - Also useful for logging users/reactions without filtering in nested functions, by targeting specific embed parameters of a reactable button.
+        - Returns True if a new entry was logged, False if that pseudo_id was already in the log.
     """
 
     # ensure ID is stored as string for dictionary consistency
     user_id_str = str(user_id)
 
-    # get the event id and compare with the user id string, and save as either accepted or declined
-    pseudo_id = (f"{event_id}-{user_id_str}"
-                 if response == "accepted"
-                 else f"{event_id}-{user_id_str}-declined"
-                 )
-
-    # if the id is not in the attendance log global dict already, then append it and its attributes
-    if pseudo_id not in attendance_log:
-        attendance_log[pseudo_id] = {
-            "timestamp": datetime.now().isoformat(),
-            "user_id": user_id_str,
-            "username": username.strip(),
-            "event_id": event_id,
-            "response": response
-        }
+    # the pseudo_id is the (event id, user id string, response) tuple, so accepted and declined are separate entries. A tuple is one small
+    # allocation and hashes from its fields, instead of formatting a new "event-user-declined" string for every response
+    pseudo_id = (event_id, user_id_str, response)
+
+    # if the id is already in the attendance log global dict, bail out before building the entry, most responses on a rescan are already
+    # logged, so this skips the timestamp and the dict for them
+    if pseudo_id in attendance_log:
+        return False
+
+    attendance_log[pseudo_id] = {
+        "timestamp": datetime.now().isoformat(),
+        "user_id": user_id_str,
+        "username": username.strip(),
+        "event_id": event_id,
+        "response": response
+    }
+    return True
 
 
 
@@ -485,14 +793,14 @@ async def dump_attendance(ctx):
 @app_commands.describe(user="Optional: get quotes said by a specific user")
 async def quote(interaction: Interaction, user: discord.Member = None):
     if user:
-        row = get_random_quote_by_user(user.id)
+        row = await asyncio.to_thread(get_random_quote_by_user, user.id)
         if not row:
             await interaction.response.send_message(
                 f"No quotes from {user.display_name} yet.", ephemeral=True
             )
             return
     else:
-        row = get_random_quote()
+        row = await asyncio.to_thread(get_random_quote)
         if not row:
             await interaction.response.send_message(
                 "No quotes in the database yet.", ephemeral=True
@@ -501,7 +809,7 @@ async def quote(interaction: Interaction, user: discord.Member = None):
 
     # unpack 6 fields now (quoted_username added at the end)
     _, _, adder_username, quote_text, created_at, quoted_username = row
-    year = parser.isoparse(created_at).strftime("%Y")
+    year = datetime.fromisoformat(created_at).strftime("%Y")
     await interaction.response.send_message(
     f'"{quote_text}" - {quoted_username}, added by {adder_username}, {year}'
     )
@@ -511,7 +819,8 @@ async def quote(interaction: Interaction, user: discord.Member = None):
 @app_commands.describe(quote="The quote text",user="The person who said it")  # new required arg for user
 
 async def addquote(interaction: Interaction, quote: str, user: discord.Member):
-    add_quote(
+    await asyncio.to_thread(
+        add_quote,
         user_id=interaction.user.id,
         username=interaction.user.display_name,
         quote=quote,
@@ -531,7 +840,7 @@ async def deletequote(interaction: Interaction):
     # then we need to actually delete the quote, so we split it into 3 tasks...
 
     # 1 Fetch only the calling user's quotes
-    rows = get_user_quotes(interaction.user.id)
+    rows = await asyncio.to_thread(get_user_quotes, interaction.user.id)
     if not rows:
         await interaction.response.send_message("You have no quotes to delete.", ephemeral=True)
         return
@@ -541,7 +850,7 @@ async def deletequote(interaction: Interaction):
     options = []
     for r in rows:
         quote_id, _, _, quote_text, created_at, quoted_username = r  # unpack 6
-        year = parser.isoparse(created_at).strftime("%Y")
+        year = datetime.fromisoformat(created_at).strftime("%Y")
         label = f"{quote_text[:75]} ({year})"  # label can stay the same, or add quoted_username if useful
         options.append(discord.SelectOption(label=label, value=str(quote_id)))
 
@@ -559,7 +868,7 @@ async def deletequote(interaction: Interaction):
 
         # set the quote_id to delete based on the id at index 0, mark it as success calling the delete_quote function from utils,
         quote_id = int(select.values[0])
-        success = delete_quote(interaction2.user.id, quote_id)
+        success = await asyncio.to_thread(delete_quote, interaction2.user.id, quote_id)
 
         # if the delete_quote func doesn't throw any errors, we show the user that the quote was deleted,
         if success:
@@ -685,11 +994,12 @@ class ReminderModal(discord.ui.Modal):
         # setting the dm preference
         dm_value = dm_text.lower() in ("yes", "true", "1", "y")
 
-        # Check existing reminders, use list iteration for the user id in insertion schema which is r[1] index
-        today = datetime.now(timezone.utc).date()
+        # Check existing reminders, only this user's rows are fetched. add_reminder always stores remind_time as a UTC ISO string, so the date
+        # is just the first 10 chars and a prefix compare finds today's reminders without parsing any datetimes
+        today_str = datetime.now(timezone.utc).date().isoformat()
         existing_today = [
-            r for r in get_reminders()
-            if r[1] == interaction.user.id and parser.isoparse(r[4]).date() == today
+            r for r in await asyncio.to_thread(get_user_reminders, interaction.user.id)
+            if r["remind_time"].startswith(today_str)
         ]
         if existing_today:
             await interaction.response.send_message("You already have an active reminder today.", ephemeral=True)
@@ -697,7 +1007,8 @@ class ReminderModal(discord.ui.Modal):
 
         # store timezone-aware datetime, only convert to string here if DB expects it (which it doesn't really atm), then get the ID of the reminder
         # we have just inserted 
-        reminder_id = add_reminder(
+        reminder_id = await asyncio.to_thread(
+            add_reminder,
             interaction.user.id,
             interaction.channel.id,
             message_text,
@@ -737,7 +1048,7 @@ async def myreminders(interaction: Interaction):
     """ command to list the user's reminders and cancel them before they go off, to make a new one """
 
     # Cancel a reminder if the cancel id we set matches the id that we saved in the delete_reminder function in utils.py
-    reminders = get_user_reminders(interaction.user.id)
+    reminders = await asyncio.to_thread(get_user_reminders, interaction.user.id)
     if not reminders:
         await interaction.response.send_message("You have no active reminders.", ephemeral=True)
         return
@@ -746,7 +1057,7 @@ async def myreminders(interaction: Interaction):
     options = []
     for r in reminders:
         reminder_id, _, _, message, time_str, dm_flag = r
-        time_fmt = parser.isoparse(time_str).strftime("%Y-%m-%d %H:%M UTC")
+        time_fmt = datetime.fromisoformat(time_str).strftime("%Y-%m-%d %H:%M UTC")
         label = f"{message[:50]} ({time_fmt})"
         description = "DM" if dm_flag else "Channel"
         options.append(discord.SelectOption(label=label, description=description, value=str(reminder_id)))
@@ -771,7 +1082,7 @@ async def myreminders(interaction: Interaction):
         reminder_id = int(select.values[0])
 
         # make sure there is fallback, if no issues or if indeed issues, let the user know.
-        success = delete_reminder(reminder_id, interaction2.user.id)
+        success = await asyncio.to_thread(delete_reminder, reminder_id, interaction2.user.id)
         if success:
             # Cancel the running asyncio task
             task = scheduled_reminders.pop(reminder_id, None)
@@ -804,22 +1115,35 @@ async def show_apollo_embeds(interaction: discord.Interaction, limit: int = 50):
     """
     This command allows you to do the first 'reverse engineering' part i.e., shows ALL aspects of an apollo embed for an event or anything else 
         that the bot has 'posted' in any channel. 
-        - Can be adapted for any bot or embed, change this `if "Apollo" in msg.author.name:` bit, from 'Apollo' to whichever user or bot you want.
+        - Can be adapted for any bot or embed, change the APOLLO_AUTHOR string, from 'Apollo' to whichever user or bot you want.
     """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
     found = 0
     limit = min(limit, 200)
+    blocks = []
+
+    # an embed description can be up to 4096 chars, more than fits in one message. chunk_lines would slice a block that long straight through
+    # its code fence and the next message would render unfenced, so a long description is cut into pieces here instead, each one closing
+    # its fence and the next one reopening it. The header and the two fences are left room for so every block fits in a 1900 char chunk
+    header = "Embed description:\n"
+    piece_len = 1900 - len(header) - 6
 
     async for msg in interaction.channel.history(limit=limit):
-        if "Apollo" in msg.author.name:
+        if is_apollo_author(msg.author):
             found += 1
             for embed in msg.embeds:
-                await interaction.channel.send(f"Embed description:\n```{embed.description}```")
+                description = str(embed.description)
+                for start in range(0, len(description) or 1, piece_len):
+                    blocks.append(f"{header if start == 0 else ''}```{description[start:start + piece_len]}```")
+
+    # every block now fits in a chunk, so chunk_lines keeps each one whole and only packs them together, we send a handful of packed messages
+    # instead of one per embed (discord rate limits every single send)
+    for chunk in chunk_lines(blocks):
+        await interaction.channel.send(chunk)
 
     if found == 0:
         await interaction.response.send_message(f"No Apollo messages found in last {limit} messages.")
@@ -833,16 +1157,14 @@ async def show_apollo_embeds(interaction: discord.Interaction, limit: int = 50):
 async def recent_authors(interaction: discord.Interaction, limit: int = 20):
     """ Command that lets you scan the members/users who have made message/post in the desired channel and show you who they are."""
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
-    authors = set()
     limit = min(limit, 200)
 
-    async for msg in interaction.channel.history(limit=limit):
-        authors.add(msg.author.name)
+    # async set comprehension, the set does the dedupe as the messages come in
+    authors = {msg.author.name async for msg in interaction.channel.history(limit=limit)}
 
     result = ", ".join(authors)
     await interaction.response.send_message(
@@ -855,8 +1177,9 @@ async def recent_authors(interaction: discord.Interaction, limit: int = 20):
 async def clear_cache(interaction: discord.Interaction):
     """ Clears the bots logs and cache to re-run data-sensitive commands """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    global apollo_author_id
+
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -867,6 +1190,12 @@ async def clear_cache(interaction: discord.Interaction):
     if 'attendance_log' in globals():
         attendance_log.clear()
 
+    # and the fetched channel history, so the next scan reads fresh messages from discord
+    history_cache.clear()
+
+    # and forget Apollo's pinned id, the next scan of CHANNEL_ID pins it again
+    apollo_author_id = None
+
     await interaction.response.send_message("Apollo scan cache cleared successfully.", ephemeral=True)
 
 
@@ -918,7 +1247,8 @@ async def hilf(interaction: discord.Interaction):
 
     embed.add_field(
         name="/scan_all_reactions",
-        value="Mainly used for analysing the reactions to messages, includes all reaction types and which member reacted with what.",
+        value="Mainly used for analysing the reactions to messages, includes all reaction types and which member reacted with what. "
+              "Set 'hours' to only look at messages from the last few hours.",
         inline=False
     )
 
@@ -985,20 +1315,37 @@ async def hilf(interaction: discord.Interaction):
     await interaction.followup.send(embed=embed)
 
 
+# In-memory copy of the staff meeting note template, filled by load_staff_notes on first use
+staff_notes_text: str | None = None
+
+
+def load_staff_notes() -> str:
+    """ Reads 'staff_meeting_note.md' once and serves it from memory after that, the template doesn't change while the bot is running.
+        Read errors are raised and not cached, so a missing file can be added without restarting the bot. """
+
+    global staff_notes_text
+
+    if staff_notes_text is None:
+        with open('staff_meeting_note.md', 'r', encoding='utf-8') as file:
+            staff_notes_text = file.read()
+    return staff_notes_text
+
+
 @bot.tree.command(name="staff_meeting_notes", description="Paste staff meeting note template.")
 async def staff_meeting_notes(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)  # defer in case it takes a moment
 
     """ Command takes a markdown file and generates it in the desired/mentioned discord channel. Directly invoked in dockerfile."""
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
     try:
-        with open('staff_meeting_note.md', 'r', encoding='utf-8') as file:
-            notes_text = file.read()
+        # served from memory after the first read, and that first read goes through a worker thread so the disk read doesn't block the event loop
+        notes_text = staff_notes_text
+        if notes_text is None:
+            notes_text = await asyncio.to_thread(load_staff_notes)
 
         if not notes_text.strip():
             await interaction.followup.send("Error: Template file is empty!")
@@ -1022,8 +1369,7 @@ async def staff_meeting_notes(interaction: discord.Interaction):
 async def debug_apollo(interaction: discord.Interaction, limit: int = 50):
     """ Debugging function that shows any Apollo message and embed if found. """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1033,7 +1379,8 @@ async def debug_apollo(interaction: discord.Interaction, limit: int = 50):
 
     async for msg in interaction.channel.history(limit=limit):
 
-        if "apollo" in msg.author.name.lower():
+        # same author check as the other scanners, no need to build a lowercased copy of every author name
+        if is_apollo_author(msg.author):
             found = True
 
             if not msg.embeds:
@@ -1059,16 +1406,9 @@ async def debug_apollo(interaction: discord.Interaction, limit: int = 50):
         await interaction.followup.send("Apollo messages found, but no embeds to show.")
         return
 
-    # Send messages in chunks under 1900 characters
-    chunk = ""
-    for msg in messages:
-        if len(chunk) + len(msg) > 1900:
-            await interaction.followup.send(chunk)
-            chunk = ""
-        chunk += msg + "\n\n"
-
-    if chunk:
-        await interaction.followup.send(chunk)
+    # this is a raw debug dump so chunk order doesn't matter, send them all at once instead of waiting on a round trip per chunk.
+    # chunk_lines keeps each embed/field block whole and blank-line separated, same as every other chunked reply
+    await asyncio.gather(*(interaction.followup.send(chunk) for chunk in chunk_lines(messages, sep="\n\n")))
 
 
 @bot.tree.command(name="debug_duplicates",
@@ -1080,23 +1420,22 @@ async def debug_duplicates(interaction: discord.Interaction):
         - The normalized names are passed to the temp list (by calling the normalized_name function) and outputs a message in discord accordingly.
     """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
+    # Defer in case it takes time, before the grouping below so a big attendance log can't run us past discord's 3 second ack window
+    await interaction.response.defer(thinking=True)
+
     seen = defaultdict(set)
 
-    # Normalize usernames and group them
-    for entry in attendance_log.values():
-        normalized = normalize_name(entry["username"])
-        seen[normalized].add(entry["username"])
+    # Normalize usernames and group them, every member is logged once per event so collapse to the distinct usernames first and
+    # only normalize each of those once
+    for username in {entry["username"] for entry in attendance_log.values()}:
+        seen[normalize_name(username)].add(username)
 
     duplicates = {k: v for k, v in seen.items() if len(v) > 1}
 
-    # Defer in case it takes time
-    await interaction.response.defer(thinking=True)
-
     if not duplicates:
         await interaction.followup.send("No username inconsistencies found.")
     else:
@@ -1104,12 +1443,7 @@ async def debug_duplicates(interaction: discord.Interaction):
         for k, versions in duplicates.items():
             lines.append(f"{k}: {', '.join(versions)}")
 
-        message = "\n".join(lines)
-        if len(message) > 1900:
-            for chunk in [message[i:i + 1900] for i in range(0, len(message), 1900)]:
-                await interaction.followup.send(chunk)
-        else:
-            await interaction.followup.send(message)
+        await send_chunked(interaction, "\n".join(lines))
 
 
 @bot.tree.command(name="scan_apollo", description="Scan Apollo event embeds and log attendance.")
@@ -1120,8 +1454,7 @@ async def scan_apollo(interaction: discord.Interaction, limit: int = 18):
         reactions thereto.
     """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1275,8 +1608,7 @@ async def check_member(interaction: discord.Interaction, user: discord.Member,
                        limit: app_commands.Range[int, 1, 24] = 8):
     """ Function allows checking an active member's 'stats' and filter by name/squad/rank """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1289,27 +1621,19 @@ async def check_member(interaction: discord.Interaction, user: discord.Member,
 
     # build a list of the last "limit" unique events to reduce duplication
     def event_key(ev):
-        # try several common keys, fallback to None
-        return ev.get("id") or ev.get("message_id") or ev.get("timestamp") or ev.get("title")
-
-    seen = set()
-    unique_events = []
+        # scan_apollo_events stores the apollo message id as "event_id", try that and several other common keys, fallback to None
+        return ev.get("event_id") or ev.get("id") or ev.get("message_id") or ev.get("timestamp") or ev.get("title")
 
-    # iterate from newest to oldest, collect unique keys until we have "limit"
+    # iterate from newest to oldest, collect unique keys until we have "limit". The dict keeps insertion order, so it's the seen-check and
+    # the ordered result in one. An event without any key is only a duplicate of itself (id() instead of hashing a repr of the whole event)
+    unique_events = {}
     for ev in reversed(event_log):
         key = event_key(ev)
-
-        # if no key present, we fall back to using a string representation for dedupe
-        dedupe_key = key if key is not None else repr(ev)
-        if dedupe_key in seen:
-            continue
-
-        seen.add(dedupe_key)
-        unique_events.append(ev)
+        unique_events.setdefault(key if key is not None else id(ev), ev)
         if len(unique_events) >= limit:
             break
 
-    recent_events = list(reversed(unique_events))  # restore chronological order
+    recent_events = list(reversed(unique_events.values()))  # restore chronological order
 
     # normalize the username like scan_apollo does
     target_id = user.id
@@ -1318,50 +1642,27 @@ async def check_member(interaction: discord.Interaction, user: discord.Member,
     declined = 0
     no_response = 0
 
-    def extract_uid(entry):
-
-        """Safely extract the 'uid' like value from an accepted/declined entry.
-           Accepts tuples/lists like (uid, extra) or plain strings/ints."""
-
-        if isinstance(entry, (list, tuple)) and len(entry) > 0:
-            return entry[0]
-        return entry
+    # checked once, so the event_key lookups for the debug line below are skipped entirely when debug logging is off
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
     for idx, event in enumerate(recent_events, start=1):
-        raw_accepted = event.get("accepted", [])
-        raw_declined = event.get("declined", [])
-
-        # Normalize accepted names/ids so first stringify then normalize,
-        # AND CHANGE FROM LIST TO SET BECAUSE PYTHON LISTS DON'T HAVE UNIQUE INDEXING
-        accepted_ids = set()
-        for entry in raw_accepted:
-            uid = extract_uid(entry)
-            try:
-                accepted_ids.add(int(uid))
-            except Exception:
-                logging.exception("Error extracting accepted entry in event %s: %r", event_key(event) or f"idx{idx}", entry)
-
-        declined_ids = set()
-        for entry in raw_declined:
-            uid = extract_uid(entry)
-            try:
-                declined_ids.add(int(uid))
-            except Exception:
-                logging.exception("Error extracting declined entry in event %s: %r", event_key(event) or f"idx{idx}", entry)
+        accepted_ids = event_member_ids(event, "accepted")
+        declined_ids = event_member_ids(event, "declined")
 
         accepted_match = target_id in accepted_ids
         declined_match = target_id in declined_ids
 
         # log per-event details to help debug why counts are incremented
-        logging.debug(
-            "check_member: event_idx=%d key=%s accepted_ids=%r accepted_match=%s declined_ids=%r declined_match=%s",
-            idx,
-            event_key(event) or "N/A",
-            accepted_ids,
-            accepted_match,
-            declined_ids,
-            declined_match
-        )
+        if debug_enabled:
+            logging.debug(
+                "check_member: event_idx=%d key=%s accepted_ids=%r accepted_match=%s declined_ids=%r declined_match=%s",
+                idx,
+                event_key(event) or "N/A",
+                accepted_ids,
+                accepted_match,
+                declined_ids,
+                declined_match
+            )
 
         if accepted_match and not declined_match:
             accepted += 1
@@ -1385,7 +1686,7 @@ async def check_member(interaction: discord.Interaction, user: discord.Member,
 async def rand(interaction: discord.Interaction, limit: app_commands.Range[int, 1, 1_000_001] = 100):
     """ Generate a random number between 1 and `limit`. """
 
-    result = secrets.randbelow(limit) + 1
+    result = rng.randrange(1, limit + 1)
     await interaction.response.send_message(f"**{result}**")
 
 
@@ -1394,14 +1695,14 @@ async def rand(interaction: discord.Interaction, limit: app_commands.Range[int,
 async def coin(interaction: discord.Interaction, limit: app_commands.Range[int, 1, 100] = 1):
     """  Command to flip a coin 'n' times. """
 
-    outcomes = [random.choice(["Heads", "Tails"]) for _ in range(limit)]
+    # one random bit per flip, all drawn in a single call, a set bit is heads so counting the flips is just counting the 1 bits
+    heads = rng.getrandbits(limit).bit_count()
 
     if limit == 1:
-        response = f"{outcomes[0]}"
+        response = "Heads" if heads else "Tails"
 
     else:
-        heads = outcomes.count("Heads")
-        tails = outcomes.count("Tails")
+        tails = limit - heads
 
         response = (
 
@@ -1421,8 +1722,7 @@ async def summary(interaction: discord.Interaction, limit: app_commands.Range[in
 
     await interaction.response.defer(thinking=True)
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.followup.send("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1444,41 +1744,53 @@ async def summary(interaction: discord.Interaction, limit: app_commands.Range[in
         )
         return
 
-    # set the guild variable and exclude roles from discord that we don't need to log attendance reactions for
+    # set the guild variable, the roles from discord that we don't need to log attendance reactions for are in SUMMARY_EXCLUDED_ROLES
     guild = interaction.guild
-    excluded_roles = {"Guest", "Reserves", "External Unit Rep"}
 
-    # save the valid member's roles using list iteration and check sure that they are not in the excluded_roles list, 
-    # then create valid_ids and map those ids to members
+    # resolve the excluded role names to role ids once, so each member's roles are checked with int hashes instead of name compares
+    excluded_role_ids = frozenset(role.id for role in guild.roles if role.name in SUMMARY_EXCLUDED_ROLES)
+
+    # save the valid member's roles using list iteration and check sure that they are not in the excluded roles, 
+    # then create valid_ids for the tally
+    # (bots are already filtered out of human_members, so only the role check is left to do here)
     valid_members = [
-        m for m in guild.members
-        if not m.bot and not any(role.name in excluded_roles for role in m.roles)
+        m for m in human_members(guild).values()
+        if excluded_role_ids.isdisjoint(role.id for role in m.roles)
     ]
     valid_ids = {m.id for m in valid_members}
-    id_to_member = {m.id: m for m in valid_members}
 
-    # save the number of responses in a dict, with k=member and v=event
-    response_count = defaultdict(int)
-
-    # then for each event, from the recent events scanned, for each category in the events, for each user_id in either category,
-    # if the user's id is valid, increment the response count dict
-    for event in recent_events:
-        for category in ("accepted", "declined"):
-            for user_id, _ in event.get(category, []):
-                if user_id in valid_ids:
-                    response_count[user_id] += 1
+    # save the number of responses in a Counter, with k=member and v=event
+    response_count = Counter()
 
     # create a dict for low responders with the user id and event id, limit it by a threshold of 2 as remainder (50%)
     low_responders = defaultdict(list)
     threshold = limit // 2
 
-    # iterate over the valid ids and keep track of the user's response count, if it's lower than 50%, save that user id and append to low_responders dict
-    for user_id in valid_ids:
-        count = response_count.get(user_id, 0)
-        if count <= threshold:
-            member = id_to_member.get(user_id)
-            if member:
+    # only members at or under the threshold end up in the summary, so once someone goes over it their exact count stops mattering. pending holds
+    # the members that can still end up in the summary, anyone who goes over is dropped from it, and if it runs empty every member has already
+    # responded enough and the rest of the events don't need tallying at all
+    pending = set(valid_ids)
+
+    # then for each event, from the recent events scanned, for each category in the events, count every still pending user_id in that category
+    for event in recent_events:
+        for category in ("accepted", "declined"):
+            # intersect with the per-event id index so the set does the membership work in C instead of a python loop per response,
+            # and Counter.update does the incrementing in C too
+            responded = pending.intersection(event_member_ids(event, category))
+            response_count.update(responded)
+            pending.difference_update([user_id for user_id in responded if response_count[user_id] > threshold])
+
+        if not pending:
+            break
+
+    # single pass over the valid members, read each member's response count and if it's 50% or lower bucket the member straight into low_responders
+    # (nothing to bucket if nobody is left pending)
+    if pending:
+        for member in valid_members:
+            count = response_count[member.id]  # a Counter gives 0 for members that never responded
+            if count <= threshold:
                 low_responders[count].append(member)
+
     # send message detail
     lines = [
         f"**Low Attendance Summary (Last {limit} Apollo Events)**",
@@ -1489,23 +1801,19 @@ async def summary(interaction: discord.Interaction, limit: app_commands.Range[in
     if not low_responders:
         lines.append(f"All active members responded to more than {threshold} events!")
     else:
-        for i in range(0, threshold + 1):
-            group = low_responders.get(i, [])
-            if group:
-                lines.append(f"\n**Members with {i}/{limit} Responses:**")
-                for member in sorted(group, key=lambda m: m.display_name.lower()):
-                    lines.append(f"- **{member.display_name}** ✅❌ | No Response: {limit - i}")
+        # only the counts that actually have members in them, lowest first
+        for i in sorted(low_responders):
+            lines.append(f"\n**Members with {i}/{limit} Responses:**")
+            lines.extend(
+                f"- **{member.display_name}** ✅❌ | No Response: {limit - i}"
+                for member in sorted(low_responders[i], key=lambda m: m.display_name.lower())
+            )
 
     lines.append(
         f"\n_Scanned {scanned_messages} messages to find {limit} Apollo events. Logged {logged} participant responses._")
 
-    # send the message by joining the line list, send them chunk by chunk due to char limit
-    message = "\n".join(lines)
-    if len(message) > 1900:
-        for chunk in [message[i:i + 1900] for i in range(0, len(message), 1900)]:
-            await interaction.followup.send(chunk)
-    else:
-        await interaction.followup.send(message)
+    # send the message by joining the line list, if it's over the char limit it's sent as a preview plus the full summary as a file
+    await send_chunked(interaction, "\n".join(lines), filename="summary.txt")
 
     event_log.clear()
     if 'attendance_log' in globals():
@@ -1514,14 +1822,14 @@ async def summary(interaction: discord.Interaction, limit: app_commands.Range[in
 
 @bot.tree.command(name="scan_all_reactions", description="Scan recent messages for reactions and summarize them.")
 @app_commands.describe(channel="The channel to scan for reactions",
-                       limit="How many recent messages to scan (default is 5)")
+                       limit="How many recent messages to scan (default is 5)",
+                       hours="Only scan messages from the last 'n' hours (default 0, no cutoff)")
 async def scan_all_reactions(interaction: discord.Interaction, channel: TextChannel,
-                             limit: app_commands.Range[int, 1, 100] = 5):
+                             limit: app_commands.Range[int, 1, 100] = 5, hours: app_commands.Range[int, 0, 720] = 0):
     """ Function uses the TextChannel object from discord's library passed as a parameter, to allow the user to make this command
         in any channel and from any channel that the bot has message history and other relevant permissions for. """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1532,40 +1840,69 @@ async def scan_all_reactions(interaction: discord.Interaction, channel: TextChan
         await interaction.followup.send(f"Can't read message history in {channel.mention}.")
         return
 
-    # initialize scanned to 0, and a dict of emoji lists
-    scanned = 0
-
     # instead of a single emoji_summary, map message -> emoji -> users
     message_summaries = []
 
-    # We want to check every message in the channel this command is made in, and for every message amount mentioned when making the "/command",
-    # increment the scanned counter, for the channel provided (don't use 'interaction.channel.history' if you want to preserve channel specificity)
-    async for msg in channel.history(limit=limit):
-        scanned += 1
+    # We want to check every message in the channel this command is made in, up to the amount mentioned when making the "/command", for the
+    # channel provided (don't use 'interaction.channel.history' if you want to preserve channel specificity). The history is pulled in one pass
+    # and nothing awaits it again afterwards, if the channel runs out before the limit discord.py just stops there
+    if hours:
+        # history comes newest first, so the first message older than the cutoff means every message after it is too. Breaking out of the
+        # loop stops discord.py from fetching any more pages
+        cutoff = discord.utils.utcnow() - timedelta(hours=hours)
+        history = []
+        async for msg in channel.history(limit=limit):
+            if msg.created_at < cutoff:
+                break
+            history.append(msg)
+    else:
+        history = [msg async for msg in channel.history(limit=limit)]
+    scanned = len(history)
 
-        # Skip messages with no reactions
-        if not msg.reactions:
-            continue
+    # Skip messages with no reactions, the reactor lists only get fetched for the ones that are left
+    messages = [msg for msg in history if msg.reactions]
 
-        # Temporary dict of lists of reactions to store reactions for this message
-        msg_reactions = defaultdict(list)
+    # bound once up here, it's the same guild for every reactor of every reaction
+    get_member = interaction.guild.get_member
 
-        # Only consider users, not bots
-        for reaction in msg.reactions:
-            users = [user async for user in reaction.users()]
+    # user id -> name to show, the same people react to most messages so each one is only resolved once per command
+    display_names: dict[int, str] = {}
 
+    async def reactor_names(reaction):
+        """ Fetch one reaction's users and return the display names of the ones that aren't bots. """
+
+        names = []
+        add = names.append
+        async for user in reaction.users():
             # Only considering users NOT bots, IMP CHECK!
-            for user in users:
-                if user.bot:
-                    continue
+            if user.bot:
+                continue
+
+            # Set a var member, using Discord's guild object and use the get_member method for that user.id, also set display_name to that member
+            # display name, if the user is a member, else just get the discord username (because nickname for non-members might not be set)
+            name = display_names.get(user.id)
+            if name is None:
+                member = get_member(user.id)
+                name = display_names[user.id] = member.display_name if member else user.name
+            add(name)
+
+        return names
+
+    # Every reaction.users() call is its own API round trip, so start them all at once instead of awaiting them one after another.
+    # gather hands the results back in the same order the coroutines were passed in, so we can walk them in step with the messages below
+    reactor_lists = iter(await asyncio.gather(*(reactor_names(reaction) for msg in messages for reaction in msg.reactions)))
 
-                # Set a var member, using Discord's guild object and use the get_member method for that user.id, also set display_name to that member
-                # display name, if the user is a member, else just get the discord username (because nickname for non-members might not be set)
-                member = interaction.guild.get_member(user.id)
-                display_name = member.display_name if member else user.name
+    for msg in messages:
+
+        # Temporary dict of sets of reactions to store reactions for this message, a set so the same display name only counts once per emoji
+        msg_reactions = defaultdict(set)
+
+        for reaction in msg.reactions:
+            names = next(reactor_lists)
 
-                # append the msg_reactions temp dict with the emoji mapped to the display_name
-                msg_reactions[str(reaction.emoji)].append(display_name)
+            # a reaction made only by bots shouldn't show up at all
+            if names:
+                msg_reactions[str(reaction.emoji)].update(names)
 
         if msg_reactions:
             # Trim message content to first 100 chars for readability
@@ -1577,7 +1914,7 @@ async def scan_all_reactions(interaction: discord.Interaction, channel: TextChan
             # who wrote the message
             # shortened preview of message
             # link to jump to og message
-            # a dict of emoji: list of users who reacted
+            # a dict of emoji: set of users who reacted
             message_summaries.append({
 
                 "author": msg.author.display_name,
@@ -1589,7 +1926,9 @@ async def scan_all_reactions(interaction: discord.Interaction, channel: TextChan
 
     # Check for if the messages even exist
     if not message_summaries:
-        await interaction.followup.send(f"No reactions found in the last {limit} messages of {channel.mention}.")
+        # scanned, not limit, since the hours cutoff can stop the scan well before limit messages
+        window = f" from the last {hours} hours" if hours else ""
+        await interaction.followup.send(f"No reactions found in the last {scanned} messages{window} of {channel.mention}.")
         return
 
     # Set a list of lines as an f string to show number of scanned messages
@@ -1606,16 +1945,15 @@ async def scan_all_reactions(interaction: discord.Interaction, channel: TextChan
 
         # Then for each emoji, user in the emoji_summary dict (we are unpacking the dict, using .items() to index into the dict)
         for emoji, users in msg_data['reactions'].items():
-            # Get a set of unique users
-            unique_users = set(users)
-
-            # Append the 'lines' list with the f string of each emoji, mapped to each set of users
-            lines.append(f"> {emoji} - {len(users)} reaction(s) from: {', '.join(unique_users)}")
+            # Append the 'lines' list with the f string of each emoji, mapped to each set of users. users is already a set, so the count and the
+            # names listed after it agree with each other
+            lines.append(f"> {emoji} - {len(users)} reaction(s) from: {', '.join(users)}")
 
         # Blank line between messages, if the number of messages to be shown > 1
         lines.append("")
 
-    await interaction.followup.send("\n".join(lines))
+    # a 100 message scan with a few reactions each easily goes past discord's char limit, so this goes out in chunks too
+    await send_chunked(interaction, "\n".join(lines))
 
 
 # TODO: Add explicit Astro Award and Good Conduct award automatically in the end summary
@@ -1633,8 +1971,7 @@ async def leaderboard(interaction: discord.Interaction, limit: app_commands.Rang
         - Functionality of this command can be adapted for any other rank-based uses, read the comments, and you'll get an idea.
     """
 
-    required_role = discord.utils.get(interaction.user.roles, name="NCO")
-    if required_role is None:
+    if not is_nco(interaction.user):
         await interaction.response.send_message("You must be an **NCO** to use this command.", ephemeral=True)
         return
 
@@ -1650,45 +1987,47 @@ async def leaderboard(interaction: discord.Interaction, limit: app_commands.Rang
     # NOTE--- in this case it's only accepted and declined because that's my use case, you can have multiple, just follow this template/general idea
 
     # the general idea being, we want EACH parsed representation of a type of reaction-user mapping to be its own data structure for cleanliness and 
-    # separation of concerns. I want the number of declined and accepted, a set of unique users and a dict of pretty names (nickname scanned by "scan_apollo")
-    accepted_count = defaultdict(int)
-    declined_count = defaultdict(int)
-    unique_users = set()
+    # separation of concerns. I want the number of declined and accepted, and a dict of pretty names (nickname scanned by "scan_apollo")
+    accepted_count = Counter()
+    declined_count = Counter()
+    responded_count = Counter()  # events each user reacted to at all, for the good conduct award
     pretty_names = {}
 
     # for every event in the scanned recent events, we will be going over the accepted reactions and declined reactions
     for event in recent_events:
+        accepted = event["accepted"]
+        # similar for declined users, just that we use event.get, since older entries might not have a declined list
+        declined = event.get("declined", [])
 
-        # then for each normal user_id and the pretty version thereof in the accepted category list of that event,
-        for user_id, pretty in event["accepted"]:
-            # increment the accepted count dict by 1, then for every user_id in the pretty_names dict, we set that to the pretty i.e., the nickname, and
-            # add that user_id to the set of unique users
-            accepted_count[user_id] += 1
-            pretty_names[user_id] = pretty
-            unique_users.add(user_id)
-
-        # similar for declined users, just that we use event.get, a temp list of declined while iterating, to keep track of how many user_id and pretty
-        for user_id, pretty in event.get("declined", []):
-            # increment the declined users by 1, add that user_id to the unique users set, and strip any trailing/leading whitespace before setting
-            # those user_id equal to the user_id in the pretty_names dict
-            declined_count[user_id] += 1
-            unique_users.add(user_id)
-            pretty_names[user_id] = pretty.strip()
-
-    # now we want to sort the accepted users by counting that dict and using a lambda function that sorts them by descending
-    accepted_sorted = sorted(
-        accepted_count.items(),
-        key=lambda x: (-x[1], x[0])
-    )
+        # Counter.update counts a whole event's user_ids in one call (the counting loop runs in C) instead of a += 1 per response
+        accepted_count.update(user_id for user_id, _ in accepted)
+        declined_count.update(user_id for user_id, _ in declined)
+
+        # the union counts a user once per event, even if they somehow ended up under both accepted and declined for it
+        responded_count.update(event_member_ids(event, "accepted") | event_member_ids(event, "declined"))
+
+        # the (user_id, pretty) tuples go straight into the pretty_names dict, later events overwrite earlier ones same as before, and declined
+        # after accepted. No strip needed here, scan_apollo_events already strips the display names it stores in the event_log
+        pretty_names.update(accepted)
+        pretty_names.update(declined)
+
+    # the unique users are everyone who shows up in either count, one union of the two key views once the tally is done
+    unique_users = accepted_count.keys() | declined_count.keys()
+
+    # now we want to sort the accepted users by count descending, then name. The count is negated into the tuple itself so plain tuple
+    # comparison does the ordering, no lambda call per item
+    accepted_sorted = sorted((-count, user_id) for user_id, count in accepted_count.items())
 
     # we want a similar 'lines' list as previous function to show the leaderboard
     lines = [f"**Attendance Leaderboard (Last {limit} Events)**"]
     total_events = len(recent_events)
 
-    # and for each user 'user_id' and the 'count' (tuple) we want to number it firstly, then, append to the lines list by using the fstring of how we want
-    # the data to be shown
-    for i, (user_id, count) in enumerate(accepted_sorted, start=1):
-        lines.append(f"{i}. **{pretty_names[user_id]}** - {count}/{total_events} events ✅")
+    # and for each user 'user_id' and the 'count' (tuple) we want to number it firstly, then, add to the lines list by using the fstring of how we want
+    # the data to be shown. The rows go in with one extend from a generator instead of an append call per row
+    lines.extend(
+        f"{i}. **{pretty_names[user_id]}** - {-neg_count}/{total_events} events ✅"
+        for i, (neg_count, user_id) in enumerate(accepted_sorted, start=1)
+    )
 
     # check how many unique attendees, if at all
     if accepted_count:
@@ -1696,51 +2035,49 @@ async def leaderboard(interaction: discord.Interaction, limit: app_commands.Rang
     else:
         lines.append("\nNo attendees found in last 8 events.")
 
-    # then we make a declined exclusive dict, where we are using dict iteration to check key-name, for value-count, in the declined_count dict, is only there
-    # if it's not there in the accepted_count dict. SO, if they declined, they should not be in accepted dict
-    declined_only = {
-        name: count for name, count in declined_count.items()
-        if name not in accepted_count
-    }
+    # then we sort the declined-only users, a user is only there if they're not in the accepted_count dict. SO, if they declined, they should
+    # not be in accepted dict. The key view difference picks those users out in C (no interim declined-only dict)
+    declined_sorted = sorted((-declined_count[user_id], user_id) for user_id in declined_count.keys() - accepted_count.keys())
 
-    # if that above dict is true, append to the lines list with a fstring to show the data, same as accepted_sorted
-    if declined_only:
+    # if there are any, append to the lines list with a fstring to show the data, same as accepted_sorted
+    if declined_sorted:
 
         lines.append(f"\n**Declined (❌)**")
-        declined_sorted = sorted(
-            declined_only.items(),
-            key=lambda x: (-x[1], x[0])
-        )
 
-        for i, (norm_name, count) in enumerate(declined_sorted, start=1):
-            display_name = pretty_names.get(norm_name, norm_name).strip()
-            lines.append(f"{i}. **{display_name}** - {count} declines ❌")
+        # the strip stays here for event_log entries that didn't come from the scanner, but it's once per declined-only user now rather than
+        # once per declined row in the tally
+        lines.extend(
+            f"{i}. **{pretty_names.get(norm_name, norm_name).strip()}** - {-neg_count} declines ❌"
+            for i, (neg_count, norm_name) in enumerate(declined_sorted, start=1)
+        )
 
     lines.append(f"\nTotal unique responders: {len(unique_users)}")
 
-    # Astro Award - members who accepted all 8 events
-    astro_award_winners = [
-        pretty_names[user_id]
-        for user_id, count in accepted_count.items()
-        if count == total_events
-    ]
+    # Astro Award - members who accepted all 8 events. accepted_sorted already has the highest counts first, so walk it only until the first
+    # member who missed one, instead of going over every accepted user again
+    astro_award_winners = []
+    for neg_count, user_id in accepted_sorted:
+        if -neg_count < total_events:
+            break
+        astro_award_winners.append(pretty_names[user_id])
 
     if astro_award_winners:
         lines.append("\n**Astro Award**")
-        for winner in astro_award_winners:
-            lines.append(f"🏅 {winner} - Attended all {total_events} events!")
+        lines.extend(f"🏅 {winner} - Attended all {total_events} events!" for winner in astro_award_winners)
 
-    # Same for good conduct award - members who reacted to all events (accepted or declined)
+    # Same for good conduct award - members who reacted to all events (accepted or declined). Everyone who responded is in exactly one of
+    # accepted_sorted or declined_sorted (declined-only users), so walk those two instead of the unordered unique_users set, which also lists
+    # the winners in leaderboard order. responded_count is one lookup per user instead of adding up the accepted and declined counts
     reacted_all_events = [
         pretty_names[user_id]
-        for user_id in unique_users
-        if accepted_count[user_id] + declined_count[user_id] == total_events
+        for sorted_users in (accepted_sorted, declined_sorted)
+        for _, user_id in sorted_users
+        if responded_count[user_id] == total_events
     ]
 
     if reacted_all_events:
         lines.append("\n**Good Conduct Award**")
-        for member in reacted_all_events:
-            lines.append(f"🏅 {member} - Reacted to all {total_events} events!")
+        lines.extend(f"🏅 {member} - Reacted to all {total_events} events!" for member in reacted_all_events)
 
     # if message exceeds character limit then send the next chunk in a new line/message
     message = "\n".join(lines)
@@ -1748,12 +2085,8 @@ async def leaderboard(interaction: discord.Interaction, limit: app_commands.Rang
     # defer response to allow time if needed
     await interaction.response.defer(thinking=True)
 
-    # send large messages in chunks
-    if len(message) > 1900:
-        for chunk in [message[i:i + 1900] for i in range(0, len(message), 1900)]:
-            await interaction.followup.send(chunk)
-    else:
-        await interaction.followup.send(message)
+    # send large messages as a preview plus the full leaderboard as a file
+    await send_chunked(interaction, message, filename="leaderboard.txt")
 
 
 # Run the bot with token of server
@@ -130,9 +130,7 @@ async def show_apollo_embeds(ctx):
 # lets list recent messages and their authors
 @bot.command()
 async def recent_authors(ctx):
-    authors = set()
-    async for msg in ctx.channel.history(limit=20):
-        authors.add(msg.author.name)
+    authors = {msg.author.name async for msg in ctx.channel.history(limit=20)}
     await ctx.send(f"Recent authors: {', '.join(authors)}")
 
 
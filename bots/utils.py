@@ -3,9 +3,9 @@
 import sqlite3
 import os
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
-from dateutil import parser
 from typing import Union
 
 # Configurable DB path
@@ -23,7 +23,7 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-""" Table schema we are using below for insertion and creation of reminders
+""" Table schema we are using below for insertion and creation of reminders (rows are sqlite3.Row, so r["remind_time"] and r[4] both work)
 +--------------------------------------------------------------------+
 | Index  | Column        | Type      | Example Value                 |
 | ------ | ------------- | --------- | ----------------------------- |
@@ -36,6 +36,34 @@ logging.basicConfig(
 +--------------------------------------------------------------------+
 """
 
+# One long-lived connection per db file instead of opening and closing one in every helper. Reusing the connection is what lets sqlite3's
+# statement cache work, every helper below runs the same few queries over and over, so they only get parsed and planned once.
+# check_same_thread=False so a helper can be run off the event loop in a thread, _db_lock makes sure only one of them uses the connection at a time
+_connections: dict[str, sqlite3.Connection] = {}
+_db_lock = threading.RLock()
+
+
+def get_connection(db_path=DB_PATH):
+    """ Returns the shared connection for db_path, opening it the first time it's asked for. Callers should hold _db_lock while using it. """
+
+    conn = _connections.get(db_path)
+    if conn is None:
+        # isolation_level=None is autocommit, each statement commits on its own without the sqlite3 module opening a transaction in front of
+        # every insert/delete for us. The one path that needs several statements in one transaction (add_reminders_bulk) opens it explicitly
+        conn = _connections[db_path] = sqlite3.connect(db_path, cached_statements=256, check_same_thread=False, isolation_level=None)
+
+        # rows come back as sqlite3.Row, so callers can read columns by name (r["remind_time"]) as well as by index or by unpacking like a tuple.
+        # The column names are shared by every row from the same query, not stored per row
+        conn.row_factory = sqlite3.Row
+
+        # WAL so reads don't wait on a write, and with WAL synchronous=NORMAL is still safe against corruption, it just skips the fsync on every
+        # commit (only the last commits before a power cut can be lost, which is fine for reminders and quotes). Temp tables/indices stay in memory
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
 def init_db(db_path=DB_PATH):
     """ init function to create the reminders database and if it does exist, open the db and read/write from and to it """
 
@@ -51,33 +79,35 @@ def init_db(db_path=DB_PATH):
     Path(db_path).touch(exist_ok=True)
     
     # create connection, and create the the reminders table if it doesnt exist already
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS reminders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            channel_id INTEGER NOT NULL,
-            message TEXT NOT NULL,
-            remind_time TEXT NOT NULL,
-            dm INTEGER NOT NULL
-        )
-    """)
-
-    # second table for quotes
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS quotes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            username TEXT NOT NULL,
-            quote TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            quoted_user_id INTEGER,
-            quoted_username TEXT
-        )
-    """)
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS reminders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                message TEXT NOT NULL,
+                remind_time TEXT NOT NULL,
+                dm INTEGER NOT NULL
+            )
+        """)
+
+        # /myreminders and the one reminder a day check look reminders up by user, index it so that's a b-tree lookup instead of a scan of every reminder
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reminders_user_id ON reminders(user_id)")
+
+        # second table for quotes
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS quotes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                username TEXT NOT NULL,
+                quote TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                quoted_user_id INTEGER,
+                quoted_username TEXT
+            )
+        """)
     logging.info(f"Init DB successfull on {DB_PATH}")
 
 
@@ -86,16 +116,31 @@ def get_user_reminders(user_id: int, db_path=DB_PATH):
     """ Give user the option to cancel a reminder if they put one accidentally or made a mistake. """
 
     # create a connection to dbase, select all reminders of the user who made the command NOTE this funtion is tied to the "myreminder" command in attbot.py
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(""" SELECT id, user_id, channel_id, message, remind_time, dm FROM reminders WHERE user_id = ? """, (user_id,))
-
-    rows = cursor.fetchall()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        rows = conn.execute(""" SELECT id, user_id, channel_id, message, remind_time, dm FROM reminders WHERE user_id = ? """, (user_id,)).fetchall()
     return rows 
 
 
 
+# the same insert is used by add_reminder and add_reminders_bulk, one string so the statement cache holds a single compiled copy of it
+_INSERT_REMINDER_SQL = "INSERT INTO reminders (user_id, channel_id, message, remind_time, dm) VALUES (?, ?, ?, ?, ?)"
+
+
+def _to_utc_iso(remind_time: Union[str, datetime]) -> str:
+    """ Normalizes a datetime or ISO string to the UTC-aware ISO string stored in the remind_time column. """
+
+    # datetimes (what the reminder modal passes) need no parsing at all. Strings go through the stdlib's C fromisoformat, since python 3.11
+    # it takes the ISO 8601 forms dateutil's (pure python) isoparse was here for, 'Z' suffix included. Bad strings raise ValueError
+    if not isinstance(remind_time, datetime):
+        if not isinstance(remind_time, str):
+            raise TypeError("remind_time must be a datetime or ISO-formatted string")
+        remind_time = datetime.fromisoformat(remind_time)
+
+    # hard coding the remind_time in ISO format, .astimezone is a datetime method 
+    return remind_time.astimezone(timezone.utc).isoformat()
+
+
 # Command for adding a reminder, takes input of user id, channel id, the message to save as a string, time to be reminded as, as a string as well and the
 # dm to send to the user. 
 # Also using "Union" for type safety and because we call ".astimezone" so if its a string, we dont get an AttributeError at runtime.
@@ -104,59 +149,67 @@ def add_reminder(user_id: int, channel_id: int, message: str, remind_time: Union
     """ remind_time may be a datetime or an ISO string. This function normalizes the time to
     a UTC-aware ISO string before inserting into the DB. """
 
-    # try to parse string times into datetime if needed, or fallback on ISO times
-    if isinstance(remind_time, str):
-        try:
-            remind_time = parser.isoparse(remind_time)
-        except Exception:
-            # fallback to fromisoformat for slightly different inputs
-            remind_time = datetime.fromisoformat(remind_time)
+    remind_time_str = _to_utc_iso(remind_time)
 
-    # ensure we now have a datetime
-    if not isinstance(remind_time, datetime):
-        raise TypeError("remind_time must be a datetime or ISO-formatted string")
+    with _db_lock:
+        conn = get_connection(db_path)
+        reminder_id = conn.execute(_INSERT_REMINDER_SQL, (user_id, channel_id, message, remind_time_str, int(dm))).lastrowid
 
-    # hard coding the remind_time in ISO format, .astimezone is a datetime method 
-    remind_time_utc = remind_time.astimezone(timezone.utc)
-    remind_time_str = remind_time_utc.isoformat()
+    return reminder_id
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("""INSERT INTO reminders (user_id, channel_id, message, remind_time, dm) VALUES (?, ?, ?, ?, ?)"""
-                   ,(user_id, channel_id, message, remind_time_str, int(dm)))
-    
-    reminder_id = cursor.lastrowid
-    
-    # commit the insertion and close connection
-    conn.commit()
-    conn.close()
 
-    return reminder_id
+def add_reminders_bulk(rows, db_path=DB_PATH):
+
+    """ Adds many reminders at once, rows are (user_id, channel_id, message, remind_time, dm) tuples like add_reminder's arguments.
+    All of them go in with one executemany in a single transaction, so there's one commit (and one WAL sync) for the lot instead of one per
+    reminder, and if any row fails none of them are added. Returns how many reminders were added. """
+
+    # normalize the times before taking the lock, so the transaction itself is only the inserts
+    params = [(user_id, channel_id, message, _to_utc_iso(remind_time), int(dm)) for user_id, channel_id, message, remind_time, dm in rows]
+
+    with _db_lock:
+        conn = get_connection(db_path)
+
+        # the connection is in autocommit, so the batch gets its own explicit transaction, and everything is rolled back if an insert raises
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(_INSERT_REMINDER_SQL, params)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    return len(params)
 
 
 
 # function to get reminders for the user, to see what and how many reminders they have
 def get_reminders(db_path=DB_PATH):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, user_id, channel_id, message, remind_time, dm FROM reminders")
-    rows = cursor.fetchall()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        rows = conn.execute("SELECT id, user_id, channel_id, message, remind_time, dm FROM reminders").fetchall()
     return rows
 
 
 
+# check a single reminder is still in the db, without loading every reminder just to look for one id
+def reminder_exists(reminder_id: int, db_path=DB_PATH):
+    with _db_lock:
+        conn = get_connection(db_path)
+
+        # id is the primary key, so this is one index lookup
+        row = conn.execute("SELECT 1 FROM reminders WHERE id = ? LIMIT 1", (reminder_id,)).fetchone()
+    return row is not None
+
+
+
 # functionality delete a reminder if a user wishes to
 def delete_reminder(reminder_id: int, user_id: int, db_path=DB_PATH):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # make sure one user cant delete another user's reminders 
-    cursor.execute(
-        "DELETE FROM reminders WHERE id = ? AND user_id = ?", (reminder_id, user_id))
-    deleted = cursor.rowcount
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+
+        # make sure one user cant delete another user's reminders 
+        deleted = conn.execute("DELETE FROM reminders WHERE id = ? AND user_id = ?", (reminder_id, user_id)).rowcount
     return deleted > 0
 
 
@@ -164,88 +217,72 @@ def migrate_add_quoted_user(db_path=DB_PATH):
 
     """Run once to add quoted_user columns if they don't exist yet."""
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    try:
-        cursor.execute("ALTER TABLE quotes ADD COLUMN quoted_user_id INTEGER")
-    except sqlite3.OperationalError:
-        pass  # column already exists
-    try:
-        cursor.execute("ALTER TABLE quotes ADD COLUMN quoted_username TEXT")
-    except sqlite3.OperationalError:
-        pass
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        cursor = conn.cursor()
+        try:
+            cursor.execute("ALTER TABLE quotes ADD COLUMN quoted_user_id INTEGER")
+        except sqlite3.OperationalError:
+            pass  # column already exists
+        try:
+            cursor.execute("ALTER TABLE quotes ADD COLUMN quoted_username TEXT")
+        except sqlite3.OperationalError:
+            pass
 
 # TODO add a quote function to let users add a quote, request a random quote, and pass an argument to request a quote from a specific person
 def add_quote(user_id: int, username: str, quote: str,
               quoted_user_id: int, quoted_username: str,   # NEW
               db_path=DB_PATH):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    created_at = datetime.now(timezone.utc).isoformat()
-    cursor.execute(
-        """INSERT INTO quotes
-           (user_id, username, quote, created_at, quoted_user_id, quoted_username)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        (user_id, username, quote, created_at, quoted_user_id, quoted_username)
-    )
-    quote_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        created_at = datetime.now(timezone.utc).isoformat()
+        quote_id = conn.execute(
+            """INSERT INTO quotes
+               (user_id, username, quote, created_at, quoted_user_id, quoted_username)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (user_id, username, quote, created_at, quoted_user_id, quoted_username)
+        ).lastrowid
     return quote_id
 
 
 def delete_quote(user_id: int, quote_id: int, db_path=DB_PATH):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "DELETE FROM quotes WHERE id = ? AND user_id = ?", (quote_id, user_id))
-    deleted = cursor.rowcount
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        deleted = conn.execute("DELETE FROM quotes WHERE id = ? AND user_id = ?", (quote_id, user_id)).rowcount
     return deleted > 0
 
 
 def get_random_quote(db_path=DB_PATH):
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        """SELECT id, user_id, username, quote, created_at, quoted_username
-           FROM quotes ORDER BY RANDOM() LIMIT 1"""
-    )
-    row = cursor.fetchone()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        row = conn.execute(
+            """SELECT id, user_id, username, quote, created_at, quoted_username
+               FROM quotes ORDER BY RANDOM() LIMIT 1"""
+        ).fetchone()
     return row
 
 
 def get_random_quote_by_user(quoted_user_id: int, db_path=DB_PATH):
     """Now filters by WHO SAID the quote, not who added it."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(
-        """SELECT id, user_id, username, quote, created_at, quoted_username
-           FROM quotes
-           WHERE quoted_user_id = ?
-           ORDER BY RANDOM() LIMIT 1""",
-        (quoted_user_id,)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        row = conn.execute(
+            """SELECT id, user_id, username, quote, created_at, quoted_username
+               FROM quotes
+               WHERE quoted_user_id = ?
+               ORDER BY RANDOM() LIMIT 1""",
+            (quoted_user_id,)
+        ).fetchone()
     return row  # None if user has no quotes
 
 
 def get_user_quotes(user_id: int, db_path=DB_PATH):
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "SELECT id, user_id, username, quote, created_at, quoted_username FROM quotes WHERE user_id = ?",
-        (user_id,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
+    with _db_lock:
+        conn = get_connection(db_path)
+        rows = conn.execute(
+            "SELECT id, user_id, username, quote, created_at, quoted_username FROM quotes WHERE user_id = ?",
+            (user_id,)
+        ).fetchall()
     return rows
 
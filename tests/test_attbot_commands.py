@@ -113,6 +113,8 @@ def test_get_required_int_env_invalid_raises(attbot_module, monkeypatch):
         (12345678901234567890, True),
         ("1234567890123456", False),
         ("abc12345678901234", False),
+        ("123456789012345678901", False),
+        ("１２３４５６７８９０１２３４５６７８", False),
     ],
 )
 def test_is_valid_snowflake(attbot_module, value, expected):
@@ -292,20 +294,19 @@ def test_remindme_sends_modal(attbot_module):
 
 def test_rand_sends_random_number(attbot_module, monkeypatch):
     interaction = MockCommandInteraction()
-    monkeypatch.setattr(attbot_module.secrets, "randbelow", lambda n: 6)
+    monkeypatch.setattr(attbot_module.rng, "randrange", lambda start, stop: 7)
     asyncio.run(attbot_module.rand.callback(interaction, 10))
     assert interaction.response.sent_messages[0]["message"] == "**7**"
 
 
 def test_coin_single_and_multiple(attbot_module, monkeypatch):
     interaction = MockCommandInteraction()
-    monkeypatch.setattr(attbot_module.random, "choice", lambda opts: "Heads")
+    monkeypatch.setattr(attbot_module.rng, "getrandbits", lambda k: 1)
     asyncio.run(attbot_module.coin.callback(interaction, 1))
     assert interaction.response.sent_messages[0]["message"] == "Heads"
 
     interaction2 = MockCommandInteraction()
-    seq = iter(["Heads", "Tails", "Heads"])
-    monkeypatch.setattr(attbot_module.random, "choice", lambda opts: next(seq))
+    monkeypatch.setattr(attbot_module.rng, "getrandbits", lambda k: 0b101)
     asyncio.run(attbot_module.coin.callback(interaction2, 3))
     msg = interaction2.response.sent_messages[0]["message"]
     assert "coin was flipped 3 times" in msg
@@ -332,6 +333,15 @@ def test_clear_cache_success_clears_logs(attbot_module):
     assert interaction.response.sent_messages[0]["message"] == "Apollo scan cache cleared successfully."
 
 
+def test_clear_cache_forgets_pinned_apollo_id(attbot_module):
+    attbot_module.apollo_author_id = 3
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")])
+
+    asyncio.run(attbot_module.clear_cache.callback(interaction))
+
+    assert attbot_module.apollo_author_id is None
+
+
 def test_recent_authors_role_required(attbot_module):
     channel = MockHistoryChannel(messages=[])
     interaction = MockCommandInteraction(roles=[], channel=channel)
@@ -369,7 +379,7 @@ def test_show_apollo_embeds_found_and_not_found(attbot_module):
     assert interaction.response.sent_messages[0]["message"].startswith("No Apollo messages found")
 
     apollo_msg = SimpleNamespace(
-        author=SimpleNamespace(name="Apollo"),
+        author=SimpleNamespace(name="Apollo", id=1, bot=True),
         embeds=[SimpleNamespace(description="hello embed")],
     )
     channel2 = MockHistoryChannel([apollo_msg])
@@ -379,6 +389,36 @@ def test_show_apollo_embeds_found_and_not_found(attbot_module):
     assert interaction2.response.sent_messages[0]["message"] == "Found 1 Apollo messages."
 
 
+def test_show_apollo_embeds_batches_descriptions(attbot_module):
+    role = SimpleNamespace(name="NCO")
+    apollo_msg = SimpleNamespace(
+        author=SimpleNamespace(name="Apollo", id=1, bot=True),
+        embeds=[SimpleNamespace(description="first"), SimpleNamespace(description="second")],
+    )
+    channel = MockHistoryChannel([apollo_msg])
+    interaction = MockCommandInteraction(roles=[role], channel=channel)
+    asyncio.run(attbot_module.show_apollo_embeds.callback(interaction, 5))
+    assert channel.sent == ["Embed description:\n```first```\nEmbed description:\n```second```"]
+    # the debug commands don't pin Apollo's id, only the CHANNEL_ID scan does
+    assert attbot_module.apollo_author_id is None
+
+
+def test_show_apollo_embeds_keeps_fences_closed_on_long_descriptions(attbot_module):
+    role = SimpleNamespace(name="NCO")
+    description = "x" * 4096
+    apollo_msg = SimpleNamespace(author=SimpleNamespace(name="Apollo", id=1, bot=True), embeds=[SimpleNamespace(description=description)])
+    channel = MockHistoryChannel([apollo_msg])
+    interaction = MockCommandInteraction(roles=[role], channel=channel)
+    asyncio.run(attbot_module.show_apollo_embeds.callback(interaction, 5))
+
+    # too long for one message, but every message opens and closes its own fence and nothing is lost
+    assert len(channel.sent) > 1
+    for chunk in channel.sent:
+        assert len(chunk) <= 1900
+        assert chunk.count("```") % 2 == 0
+    assert "".join(channel.sent).replace("Embed description:\n", "").replace("`", "").replace("\n", "") == description
+
+
 def test_summary_role_required(attbot_module):
     interaction = MockCommandInteraction(roles=[], guild=SimpleNamespace(members=[]))
     asyncio.run(attbot_module.summary.callback(interaction, 8))
@@ -418,4 +458,185 @@ def test_leaderboard_outputs_rankings(attbot_module):
     asyncio.run(attbot_module.leaderboard.callback(interaction, 2))
     out = interaction.followup.messages[0]["message"]
     assert "Attendance Leaderboard" in out
-    assert "Miller" in out
+    assert "1. **Miller** - 2/2 events ✅\n2. **Rydah** - 1/2 events ✅" in out
+    assert "1. **Mooses** - 1 declines ❌" in out
+
+
+def test_event_member_ids_prefers_index_and_falls_back(attbot_module):
+    indexed = {"accepted": [(1, "Miller")], "accepted_ids": frozenset({1, 2})}
+    assert attbot_module.event_member_ids(indexed, "accepted") == frozenset({1, 2})
+
+    raw = {"accepted": [(1, "Miller"), (3, "Mooses")]}
+    assert attbot_module.event_member_ids(raw, "accepted") == frozenset({1, 3})
+    assert attbot_module.event_member_ids(raw, "declined") == frozenset()
+
+    # raw entries can be string ids or plain ids too, they're coerced to int and a bad one is skipped instead of failing the whole event
+    mixed = {"event_id": 9, "accepted": [("1", "Miller"), 3, ["4"], ("oops", "Bad")]}
+    assert attbot_module.event_member_ids(mixed, "accepted") == frozenset({1, 3, 4})
+
+
+def test_is_nco_checks_role_names(attbot_module):
+    assert attbot_module.is_nco(SimpleNamespace(roles=[SimpleNamespace(name="Guest"), SimpleNamespace(name="NCO")])) is True
+    assert attbot_module.is_nco(SimpleNamespace(roles=[SimpleNamespace(name="Guest")])) is False
+    assert attbot_module.is_nco(SimpleNamespace(roles=[])) is False
+
+
+def test_setup_hook_initialises_db_once(attbot_module, monkeypatch):
+    calls = []
+    monkeypatch.setattr(attbot_module, "init_db", lambda: calls.append("init"))
+    monkeypatch.setattr(attbot_module, "migrate_add_quoted_user", lambda: calls.append("migrate"))
+
+    # registered on the bot itself, discord.py awaits bot.setup_hook() once at startup
+    assert attbot_module.bot.setup_hook is attbot_module.setup_hook
+    asyncio.run(attbot_module.bot.setup_hook())
+    assert calls == ["init", "migrate"]
+
+
+def test_is_apollo_author_pins_the_bot_id(attbot_module):
+    # a member with Apollo in their name isn't the event bot
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=5, name="Apollo Fan", bot=False)) is False
+    assert attbot_module.apollo_author_id is None
+
+    # matching without pinning (the debug commands in any channel) leaves the id unset
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=3, name="Apollo Music", bot=True)) is True
+    assert attbot_module.apollo_author_id is None
+
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=9, name="Apollo", bot=True), pin=True) is True
+    assert attbot_module.apollo_author_id == 9
+
+    # once pinned it's the id that counts, not the name
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=9, name="Renamed", bot=True)) is True
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=10, name="Apollo", bot=True)) is False
+
+
+def test_is_apollo_author_only_pins_the_exact_name(attbot_module):
+    # a look-alike bot posting first in CHANNEL_ID still matches by substring, but doesn't take the pin
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=4, name="Apollo Helper", bot=True), pin=True) is True
+    assert attbot_module.apollo_author_id is None
+
+    # so the real Apollo is still found, and pinned, after it
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=9, name="Apollo", bot=True), pin=True) is True
+    assert attbot_module.apollo_author_id == 9
+    assert attbot_module.is_apollo_author(SimpleNamespace(id=4, name="Apollo Helper", bot=True)) is False
+
+
+def test_is_nco_uses_role_ids_once_resolved(attbot_module, monkeypatch):
+    # before on_ready has resolved anything the role name is used
+    assert attbot_module.is_nco(SimpleNamespace(roles=[SimpleNamespace(name="NCO")])) is True
+
+    nco = SimpleNamespace(id=7, name="NCO")
+    guild = SimpleNamespace(id=1, roles=[nco])
+    other = SimpleNamespace(id=2, roles=[SimpleNamespace(id=8, name="Member")])
+    monkeypatch.setattr(type(attbot_module.bot), "guilds", property(lambda self: [guild, other]))
+    attbot_module.cache_nco_role_ids()
+    assert attbot_module.nco_role_ids == {1: frozenset({7})}
+
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[nco])) is True
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[SimpleNamespace(id=9, name="NCO")])) is False
+
+    # a guild without a resolved id still goes by name
+    assert attbot_module.is_nco(SimpleNamespace(guild=other, roles=[SimpleNamespace(id=10, name="NCO")])) is True
+
+
+def test_is_nco_accepts_any_role_named_nco(attbot_module):
+    # two roles share the NCO name, holding either one grants access, same as the name check did
+    first = SimpleNamespace(id=1, name="NCO")
+    second = SimpleNamespace(id=2, name="NCO")
+    guild = SimpleNamespace(id=5, roles=[first, second, SimpleNamespace(id=3, name="Member")])
+    attbot_module.cache_nco_role_id(guild)
+    assert attbot_module.nco_role_ids == {5: frozenset({1, 2})}
+
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[first])) is True
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[second])) is True
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[SimpleNamespace(id=3, name="Member")])) is False
+
+
+def test_is_nco_follows_role_events(attbot_module):
+    nco = SimpleNamespace(id=7, name="NCO")
+    guild = SimpleNamespace(id=1, roles=[nco])
+    nco.guild = guild
+    attbot_module.cache_nco_role_id(guild)
+    member = SimpleNamespace(guild=guild, roles=[nco])
+
+    # renamed away from NCO, its holders lose access
+    nco.name = "Retired"
+    asyncio.run(attbot_module.on_guild_role_update(nco, nco))
+    assert attbot_module.is_nco(member) is False
+
+    # deleted and recreated, the new role works straight away
+    guild.roles = []
+    asyncio.run(attbot_module.on_guild_role_delete(nco))
+    new_nco = SimpleNamespace(id=11, name="NCO", guild=guild)
+    guild.roles = [new_nco]
+    asyncio.run(attbot_module.on_guild_role_create(new_nco))
+    assert attbot_module.nco_role_ids == {1: frozenset({11})}
+    assert attbot_module.is_nco(SimpleNamespace(guild=guild, roles=[new_nco])) is True
+
+    # a guild joined later is resolved on join
+    joined = SimpleNamespace(id=3, roles=[SimpleNamespace(id=12, name="NCO")])
+    asyncio.run(attbot_module.on_guild_join(joined))
+    assert attbot_module.nco_role_ids[3] == frozenset({12})
+
+
+def test_human_members_index_follows_member_events(attbot_module):
+    guild = SimpleNamespace(id=42, members=[
+        SimpleNamespace(id=1, bot=False, guild=None),
+        SimpleNamespace(id=2, bot=True, guild=None),
+    ])
+    for m in guild.members:
+        m.guild = guild
+
+    assert set(attbot_module.human_members(guild)) == {1}
+
+    joined = SimpleNamespace(id=3, bot=False, guild=guild)
+    asyncio.run(attbot_module.on_member_join(joined))
+    asyncio.run(attbot_module.on_member_remove(guild.members[0]))
+    # the index is kept up to date by the events, not rebuilt from guild.members
+    assert attbot_module.human_members(guild) == {3: joined}
+
+
+def test_send_chunked_splits_long_messages(attbot_module):
+    interaction = MockCommandInteraction()
+    asyncio.run(attbot_module.send_chunked(interaction, "a" * 4000))
+    assert [len(m["message"]) for m in interaction.followup.messages] == [1900, 1900, 200]
+
+    interaction2 = MockCommandInteraction()
+    asyncio.run(attbot_module.send_chunked(interaction2, "short"))
+    assert [m["message"] for m in interaction2.followup.messages] == ["short"]
+
+
+def test_chunk_lines_breaks_between_lines(attbot_module):
+    lines = [f"{i}. **Member {i}** - 8/8 events" for i in range(200)]
+    chunks = list(attbot_module.chunk_lines(lines, 500))
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    # nothing lost or cut mid-line, joining the chunks back gives the original lines
+    assert "\n".join(chunks).split("\n") == lines
+
+
+def test_chunk_lines_custom_separator(attbot_module):
+    blocks = [f"**Field {i}**:\n```value {i}```" for i in range(100)]
+    chunks = list(attbot_module.chunk_lines(blocks, 300, sep="\n\n"))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert "\n\n".join(chunks).split("\n\n") == blocks
+
+
+def test_send_chunked_with_filename_sends_one_followup(attbot_module):
+    sent = []
+
+    class FileFollowup:
+        async def send(self, message, file=None):
+            sent.append((message, file))
+
+    interaction = SimpleNamespace(followup=FileFollowup())
+    message = "\n".join(f"{i}. **Member {i}** - 8/8 events" for i in range(200))
+    asyncio.run(attbot_module.send_chunked(interaction, message, filename="leaderboard.txt"))
+
+    assert len(sent) == 1
+    preview, file = sent[0]
+    assert len(preview) <= 1900
+    assert preview.startswith("0. **Member 0**")
+    assert file.filename == "leaderboard.txt"
+    assert file.fp.read().decode("utf-8") == message
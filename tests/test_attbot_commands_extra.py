@@ -2,6 +2,7 @@
 
 import asyncio
 import importlib
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 import pytest
@@ -284,6 +285,43 @@ def test_check_member_no_response(attbot_module):
     assert "No Response: **1**" in out
 
 
+def test_check_member_dedupes_by_event_id(attbot_module):
+    attbot_module.event_log.clear()
+    # the same apollo event logged twice only counts once
+    for _ in range(2):
+        attbot_module.event_log.append({"event_id": 10, "accepted": [(1, "Miller")], "declined": []})
+    attbot_module.event_log.append({"event_id": 11, "accepted": [], "declined": []})
+
+    role = SimpleNamespace(name="NCO")
+    interaction = MockCommandInteraction(roles=[role])
+    user = SimpleNamespace(id=1, display_name="Miller")
+    asyncio.run(attbot_module.check_member.callback(interaction, user, limit=3))
+
+    out = interaction.followup.messages[0]["message"]
+    assert "(Last 2 Events)" in out
+    assert "Accepted: **1**" in out
+    assert "No Response: **1**" in out
+
+
+# --- check_member uses the precomputed id index from scan_apollo_events ---
+def test_check_member_uses_precomputed_ids(attbot_module):
+    attbot_module.event_log.clear()
+    attbot_module.event_log.append({
+        "accepted": [],
+        "declined": [],
+        "accepted_ids": frozenset({1}),
+        "declined_ids": frozenset(),
+    })
+
+    role = SimpleNamespace(name="NCO")
+    interaction = MockCommandInteraction(roles=[role])
+    user = SimpleNamespace(id=1, display_name="Miller")
+    asyncio.run(attbot_module.check_member.callback(interaction, user, limit=1))
+
+    out = interaction.followup.messages[0]["message"]
+    assert "Accepted: **1**" in out
+
+
 # --- check_member with tuple-like entries ---
 # def test_check_member_with_string_ids(attbot_module): NOTE -> test is now invalid, t was testing the old string-ID behaviour which no longer exists.
     
@@ -305,7 +343,7 @@ def test_debug_apollo_no_apollo_messages(attbot_module):
 
 def test_debug_apollo_found_no_embeds(attbot_module):
     role = SimpleNamespace(name="NCO")
-    apollo_no_embeds = [SimpleNamespace(author=SimpleNamespace(name="Apollo"), embeds=[])]
+    apollo_no_embeds = [SimpleNamespace(author=SimpleNamespace(name="Apollo", id=1, bot=True), embeds=[])]
     channel = MockHistoryChannel(apollo_no_embeds)
     interaction = MockCommandInteraction(roles=[role], channel=channel)
     asyncio.run(attbot_module.debug_apollo.callback(interaction, limit=5))
@@ -327,7 +365,7 @@ def test_debug_apollo_found_with_embeds(attbot_module):
             self.fields = [MockField("Field1", "Value1")]
 
     apollo_msg = SimpleNamespace(
-        author=SimpleNamespace(name="Apollo"),
+        author=SimpleNamespace(name="Apollo", id=1, bot=True),
         embeds=[MockEmbed()],
     )
     channel = MockHistoryChannel([apollo_msg])
@@ -422,6 +460,137 @@ def test_scan_all_reactions_message_summaries(attbot_module):
     assert "Apollo" in output
 
 
+def test_scan_all_reactions_keeps_reactors_with_their_message(attbot_module):
+    guild = _make_guild()
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")], guild=guild)
+
+    class Reaction:
+        def __init__(self, emoji, *names):
+            self.emoji = emoji
+            self.names = names
+
+        async def users(self):
+            # the name doubles as the user id, every reactor is a different user
+            for name in self.names:
+                yield SimpleNamespace(bot=False, name=name, id=name)
+
+    first = SimpleNamespace(
+        reactions=[Reaction("✅", "Miller"), Reaction("❌", "Jones")],
+        author=SimpleNamespace(display_name="Apollo"),
+        content="first",
+        jump_url="https://test/1",
+    )
+    second = SimpleNamespace(
+        reactions=[Reaction("✅", "Smith", "Brown")],
+        author=SimpleNamespace(display_name="Apollo"),
+        content="second",
+        jump_url="https://test/2",
+    )
+
+    channel = MockHistoryChannel([first, second])
+    asyncio.run(attbot_module.scan_all_reactions.callback(interaction, channel, 5))
+
+    output = interaction.followup.messages[0]["message"]
+    first_part, second_part = output.split("**Message by Apollo**: second")
+    assert "✅ - 1 reaction(s) from: Miller" in first_part
+    assert "❌ - 1 reaction(s) from: Jones" in first_part
+    assert "Smith" in second_part and "Brown" in second_part
+    assert "Smith" not in first_part
+
+
+def test_scan_all_reactions_counts_unique_names(attbot_module):
+    guild = _make_guild()
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")], guild=guild)
+
+    class Reaction:
+        emoji = "✅"
+        async def users(self):
+            # two accounts that show up under the same name
+            yield SimpleNamespace(bot=False, name="Miller", id=1)
+            yield SimpleNamespace(bot=False, name="Miller", id=2)
+
+    msg = SimpleNamespace(
+        reactions=[Reaction()],
+        author=SimpleNamespace(display_name="Apollo"),
+        content="Attendance check",
+        jump_url="https://test/1",
+    )
+
+    channel = MockHistoryChannel([msg])
+    asyncio.run(attbot_module.scan_all_reactions.callback(interaction, channel, 5))
+
+    output = interaction.followup.messages[0]["message"]
+    assert "✅ - 1 reaction(s) from: Miller" in output
+
+
+def test_scan_all_reactions_resolves_each_reactor_once(attbot_module):
+    lookups = []
+
+    def get_member(uid):
+        lookups.append(uid)
+        return SimpleNamespace(display_name="Sgt Miller")
+
+    guild = SimpleNamespace(chunked=True, members=[], me=object(), get_member=get_member)
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")], guild=guild)
+
+    class Reaction:
+        def __init__(self, emoji):
+            self.emoji = emoji
+
+        async def users(self):
+            yield SimpleNamespace(bot=False, name="Miller", id=1)
+
+    msgs = [
+        SimpleNamespace(reactions=[Reaction("✅"), Reaction("❌")], author=SimpleNamespace(display_name="Apollo"),
+                        content=f"msg {i}", jump_url=f"https://test/{i}")
+        for i in range(3)
+    ]
+
+    asyncio.run(attbot_module.scan_all_reactions.callback(interaction, MockHistoryChannel(msgs), 5))
+
+    assert lookups == [1]
+    assert interaction.followup.messages[0]["message"].count("from: Sgt Miller") == 6
+
+
+def test_scan_all_reactions_stops_at_hours_cutoff(attbot_module):
+    guild = _make_guild()
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")], guild=guild)
+
+    class Reaction:
+        emoji = "✅"
+        async def users(self):
+            yield SimpleNamespace(bot=False, name="Miller", id=1)
+
+    now = datetime.now(timezone.utc)
+    recent = SimpleNamespace(reactions=[Reaction()], author=SimpleNamespace(display_name="Apollo"),
+                             content="recent", jump_url="https://test/1", created_at=now - timedelta(hours=1))
+    old = SimpleNamespace(reactions=[Reaction()], author=SimpleNamespace(display_name="Apollo"),
+                          content="old", jump_url="https://test/2", created_at=now - timedelta(hours=30))
+
+    asyncio.run(attbot_module.scan_all_reactions.callback(interaction, MockHistoryChannel([recent, old]), 5, 24))
+
+    output = interaction.followup.messages[0]["message"]
+    assert "from last 1 messages" in output
+    assert "recent" in output and "old" not in output
+
+
+def test_scan_all_reactions_empty_message_mentions_hours_window(attbot_module):
+    guild = _make_guild()
+    interaction = MockCommandInteraction(roles=[SimpleNamespace(name="NCO")], guild=guild)
+
+    now = datetime.now(timezone.utc)
+    quiet = SimpleNamespace(reactions=[], author=SimpleNamespace(display_name="Apollo"),
+                            content="quiet", jump_url="https://test/1", created_at=now - timedelta(hours=1))
+    old = SimpleNamespace(reactions=[], author=SimpleNamespace(display_name="Apollo"),
+                          content="old", jump_url="https://test/2", created_at=now - timedelta(hours=30))
+    channel = MockHistoryChannel([quiet, old])
+
+    asyncio.run(attbot_module.scan_all_reactions.callback(interaction, channel, 5, 24))
+
+    # the cutoff stopped the scan after 1 message, not the 5 asked for
+    assert interaction.followup.messages[0]["message"] == f"No reactions found in the last 1 messages from the last 24 hours of {channel.mention}."
+
+
 # --- ReminderModal parse_datetime edge cases ---
 def test_parse_datetime_various_formats(attbot_module):
     # ISO format with timezone
@@ -461,7 +630,7 @@ def test_scan_apollo_events_respects_limit(attbot_module, monkeypatch):
 
     class MockMsg:
         id = 1
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [MockEmbed()]
 
     class MockChan:
@@ -499,6 +668,23 @@ def test_staff_meeting_notes_success(tmp_path, attbot_module, monkeypatch):
     assert "Meeting Notes" in interaction.followup.messages[0]["message"]
 
 
+# --- staff_meeting_notes only reads the template file once ---
+def test_staff_meeting_notes_cached_after_first_read(tmp_path, attbot_module, monkeypatch):
+    role = SimpleNamespace(name="NCO")
+    template_path = tmp_path / "staff_meeting_note.md"
+    template_path.write_text("# Meeting Notes v1")
+    monkeypatch.chdir(tmp_path)
+
+    interaction = MockCommandInteraction(roles=[role])
+    asyncio.run(attbot_module.staff_meeting_notes.callback(interaction))
+
+    template_path.write_text("# Meeting Notes v2")
+    interaction2 = MockCommandInteraction(roles=[role])
+    asyncio.run(attbot_module.staff_meeting_notes.callback(interaction2))
+
+    assert interaction2.followup.messages[0]["message"] == "# Meeting Notes v1"
+
+
 # --- scan_apollo_events: guild.chunk() path ---
 def test_scan_apollo_events_chunk_guild(attbot_module, monkeypatch):
     attbot_module.event_log.clear()
@@ -524,7 +710,7 @@ def test_scan_apollo_events_chunk_guild(attbot_module, monkeypatch):
 
     class ChunkMsg:
         id = 1
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [ChunkEmbed()]
 
     class ChunkChan:
@@ -554,7 +740,7 @@ def test_scan_apollo_events_desc_empty(attbot_module, monkeypatch):
 
     class EmptyDescMsg:
         id = 99
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [EmptyDescEmbed()]
 
     class EmptyDescChan:
@@ -628,6 +814,47 @@ def test_reminder_task_cancelled(attbot_module, monkeypatch):
     assert dt.tzinfo is not None
 
 
+def test_reminder_task_sleeps_whole_delay_at_once(attbot_module, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(attbot_module.asyncio, "sleep", fake_sleep)
+    remind_time = datetime.now(timezone.utc) + timedelta(days=3)
+    asyncio.run(attbot_module.reminder_task(1, 2, 3, "msg", remind_time, False))
+
+    # one sleep for the whole 3 days, not capped at an hour
+    assert len(slept) == 1
+    assert slept[0] > 3 * 24 * 3600 - 60
+
+
+def test_reminder_task_uses_cached_user(attbot_module, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    sent = []
+
+    class User:
+        async def send(self, message):
+            sent.append(message)
+
+    async def fail_fetch(user_id):
+        raise AssertionError("fetched a user that was already cached")
+
+    monkeypatch.setattr(attbot_module.bot, "get_user", lambda user_id: User())
+    monkeypatch.setattr(attbot_module.bot, "fetch_user", fail_fetch)
+    monkeypatch.setattr(attbot_module, "reminder_exists", lambda rid: True)
+    monkeypatch.setattr(attbot_module, "delete_reminder", lambda rid, uid: True)
+
+    remind_time = datetime.now(timezone.utc) - timedelta(seconds=1)
+    asyncio.run(attbot_module.reminder_task(1, 2, 3, "Staff meeting", remind_time, True))
+
+    assert sent == ["Reminder: Staff meeting"]
+
+
 # --- debug_apollo: chunk sending ---
 def test_debug_apollo_long_output_chunks(attbot_module):
     role = SimpleNamespace(name="NCO")
@@ -644,7 +871,7 @@ def test_debug_apollo_long_output_chunks(attbot_module):
             self.fields = [BigField()]
 
     apollo_msg = SimpleNamespace(
-        author=SimpleNamespace(name="Apollo"),
+        author=SimpleNamespace(name="Apollo", id=1, bot=True),
         embeds=[BigEmbed()],
     )
     channel = MockHistoryChannel([apollo_msg])
@@ -653,6 +880,9 @@ def test_debug_apollo_long_output_chunks(attbot_module):
 
     # Should have sent multiple chunks due to 1900 char limit
     assert len(interaction.followup.messages) >= 1
+    # and never an empty chunk ahead of the oversized field
+    assert all(m["message"] for m in interaction.followup.messages)
+    assert interaction.followup.messages[0]["message"].startswith("**Embed Title:** Big")
 
 
 # --- debug_duplicates: long output chunks ---
@@ -690,7 +920,7 @@ def test_scan_apollo_events_declined_x_field(attbot_module, monkeypatch):
 
     class DeclinedXMsg:
         id = 99
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [DeclinedXEmbed()]
 
     class DeclinedXChan:
@@ -713,6 +943,8 @@ def test_scan_apollo_events_declined_x_field(attbot_module, monkeypatch):
     assert len(attbot_module.event_log) == 1
     assert len(attbot_module.event_log[0]["accepted"]) == 1
     assert len(attbot_module.event_log[0]["declined"]) == 1
+    assert attbot_module.event_log[0]["accepted_ids"] == frozenset({1})
+    assert attbot_module.event_log[0]["declined_ids"] == frozenset({2})
 
 
 # --- scan_apollo_events: with "x" in field name triggers declined ---
@@ -734,7 +966,7 @@ def test_scan_apollo_events_x_field_name(attbot_module, monkeypatch):
 
     class XFieldNameMsg:
         id = 99
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [XFieldNameEmbed()]
 
     class XFieldNameChan:
@@ -776,7 +1008,7 @@ def test_scan_apollo_events_unresolved_name(attbot_module, monkeypatch, capfd):
 
     class UnresolvedMsg:
         id = 99
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [UnresolvedEmbed()]
 
     class UnresolvedChan:
@@ -832,7 +1064,7 @@ def test_summary_role_required(attbot_module):
 
 def test_summary_with_sufficient_events(attbot_module, monkeypatch):
     role = SimpleNamespace(name="NCO")
-    guild = SimpleNamespace(members=[
+    guild = SimpleNamespace(id=42, roles=[], members=[
         SimpleNamespace(id=1, display_name="Miller", roles=[], bot=False),
         SimpleNamespace(id=2, display_name="Rydah", roles=[], bot=False),
         SimpleNamespace(id=3, display_name="Mooses", roles=[], bot=False),
@@ -859,6 +1091,51 @@ def test_summary_with_sufficient_events(attbot_module, monkeypatch):
     assert "Summary" in interaction.followup.messages[0]["message"]
 
 
+def test_summary_skips_members_with_excluded_roles(attbot_module, monkeypatch):
+    role = SimpleNamespace(name="NCO")
+    guest = SimpleNamespace(id=900, name="Guest")
+    guild = SimpleNamespace(id=42, roles=[guest], members=[
+        SimpleNamespace(id=1, display_name="Miller", roles=[], bot=False),
+        SimpleNamespace(id=2, display_name="Visitor", roles=[SimpleNamespace(id=900, name="Guest")], bot=False),
+    ])
+    interaction = MockCommandInteraction(roles=[role], guild=guild)
+
+    def fake_scan(limit):
+        attbot_module.event_log.clear()
+        attbot_module.event_log.append({"accepted": [], "declined": []})
+        return asyncio.sleep(0, result=(1, 0))
+
+    monkeypatch.setattr(attbot_module, "scan_apollo_events", fake_scan)
+    asyncio.run(attbot_module.summary.callback(interaction, limit=1))
+
+    out = interaction.followup.messages[0]["message"]
+    assert "Miller" in out
+    assert "Visitor" not in out
+
+
+def test_summary_stops_tallying_once_everyone_is_over_threshold(attbot_module, monkeypatch):
+    role = SimpleNamespace(name="NCO")
+    guild = SimpleNamespace(id=42, roles=[], members=[
+        SimpleNamespace(id=1, display_name="Miller", roles=[], bot=False),
+    ])
+    interaction = MockCommandInteraction(roles=[role], guild=guild)
+
+    class UntouchedEvent(dict):
+        def get(self, *args):
+            raise AssertionError("event tallied after every member was already over the threshold")
+
+    def fake_scan(limit):
+        attbot_module.event_log.clear()
+        attbot_module.event_log.extend({"accepted": [(1, "Miller")], "declined": []} for _ in range(3))
+        attbot_module.event_log.append(UntouchedEvent())
+        return asyncio.sleep(0, result=(4, 3))
+
+    monkeypatch.setattr(attbot_module, "scan_apollo_events", fake_scan)
+    asyncio.run(attbot_module.summary.callback(interaction, limit=4))
+
+    assert "All active members responded to more than 2 events!" in interaction.followup.messages[0]["message"]
+
+
 # --- leaderboard with no attendees ---
 def test_leaderboard_no_attendees(attbot_module):
     attbot_module.event_log.clear()
@@ -919,6 +1196,35 @@ def test_leaderboard_good_conduct_award(attbot_module):
     assert "Good Conduct Award" in output
 
 
+def test_leaderboard_good_conduct_mixed_and_declined_only(attbot_module):
+    attbot_module.event_log.clear()
+    # Miller accepts then declines, Rydah declines both, Jones misses the second event
+    attbot_module.event_log.append({"accepted": [(1, "Miller"), (3, "Jones")], "declined": [(2, "Rydah")]})
+    attbot_module.event_log.append({"accepted": [], "declined": [(1, "Miller"), (2, "Rydah")]})
+
+    role = SimpleNamespace(name="NCO")
+    interaction = MockCommandInteraction(roles=[role])
+    asyncio.run(attbot_module.leaderboard.callback(interaction, limit=2))
+
+    output = interaction.followup.messages[0]["message"]
+    award = output.split("**Good Conduct Award**")[1]
+    assert award.index("Miller") < award.index("Rydah")
+    assert "Jones" not in award
+
+
+def test_leaderboard_good_conduct_counts_each_event_once(attbot_module):
+    attbot_module.event_log.clear()
+    # Miller shows up under both lists of the first event but skipped the second one
+    attbot_module.event_log.append({"accepted": [(1, "Miller")], "declined": [(1, "Miller")]})
+    attbot_module.event_log.append({"accepted": [(2, "Rydah")], "declined": []})
+
+    role = SimpleNamespace(name="NCO")
+    interaction = MockCommandInteraction(roles=[role])
+    asyncio.run(attbot_module.leaderboard.callback(interaction, limit=2))
+
+    assert "Good Conduct Award" not in interaction.followup.messages[0]["message"]
+
+
 # --- ReminderModal parse_datetime with explicit tz ---
 def test_parse_datetime_explicit_tz(attbot_module):
     dt = attbot_module.ReminderModal.parse_datetime("2025-10-05 14:30+05:00")
@@ -991,7 +1297,7 @@ def test_reminder_modal_on_submit_success(tmp_path, attbot_module, monkeypatch):
     resp = MockDeferredResponse()
     mock_interaction = SimpleNamespace(response=resp, user=SimpleNamespace(id=10), channel=SimpleNamespace(id=20))
     monkeypatch.setattr(attbot_module, "add_reminder", lambda uid, cid, msg, dt, dm: 1)
-    monkeypatch.setattr(attbot_module, "get_reminders", lambda: [])
+    monkeypatch.setattr(attbot_module, "get_user_reminders", lambda uid: [])
 
     asyncio.run(attbot_module.ReminderModal.on_submit(modal, mock_interaction))
 
@@ -999,6 +1305,29 @@ def test_reminder_modal_on_submit_success(tmp_path, attbot_module, monkeypatch):
     assert "Reminder set" in resp.sent_messages[0]["message"]
 
 
+def test_reminder_modal_on_submit_one_reminder_per_day(attbot_module, monkeypatch):
+    from datetime import datetime, timezone
+
+    class FakeTextInput:
+        def __init__(self, val):
+            self.value = val
+
+    class FakeModal:
+        date = FakeTextInput("2099-12-01 10:00")
+        message = FakeTextInput("Test reminder")
+        dm = FakeTextInput("no")
+        parse_datetime = staticmethod(attbot_module.ReminderModal.parse_datetime)
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    resp = MockDeferredResponse()
+    mock_interaction = SimpleNamespace(response=resp, user=SimpleNamespace(id=10), channel=SimpleNamespace(id=20))
+    monkeypatch.setattr(attbot_module, "get_user_reminders", lambda uid: [{"remind_time": f"{today}T09:00:00+00:00"}])
+
+    asyncio.run(attbot_module.ReminderModal.on_submit(FakeModal(), mock_interaction))
+
+    assert resp.sent_messages[0]["message"] == "You already have an active reminder today."
+
+
 # --- scan_apollo_events: embed.description fallback ---
 def test_scan_apollo_events_desc_fallback(attbot_module, monkeypatch):
     attbot_module.event_log.clear()
@@ -1012,7 +1341,7 @@ def test_scan_apollo_events_desc_fallback(attbot_module, monkeypatch):
 
     class DescMsg:
         id = 99
-        author = SimpleNamespace(name="Apollo")
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
         embeds = [DescEmbed()]
 
     class DescChan:
@@ -1033,6 +1362,36 @@ def test_scan_apollo_events_desc_fallback(attbot_module, monkeypatch):
     assert len(attbot_module.event_log[0]["accepted"]) == 2
 
 
+# --- scan_apollo_events: same name in a field and in the description is only recorded once ---
+def test_scan_apollo_events_dedupes_field_and_description(attbot_module, monkeypatch):
+    attbot_module.event_log.clear()
+
+    class DupEmbed:
+        def __init__(self):
+            self.fields = [SimpleNamespace(name="Accepted", value="- Miller")]
+            self.description = "- Miller"
+
+    class DupMsg:
+        id = 99
+        author = SimpleNamespace(name="Apollo", id=1, bot=True)
+        embeds = [DupEmbed()]
+
+    class DupChan:
+        async def history(self, limit=None):
+            yield DupMsg()
+
+    class DupGuild:
+        chunked = True
+        members = [SimpleNamespace(id=1, display_name="Miller", name="Miller")]
+
+    monkeypatch.setattr(attbot_module.bot, "get_channel", lambda x: DupChan())
+    monkeypatch.setattr(attbot_module.bot, "get_guild", lambda x: DupGuild())
+
+    scanned, logged = asyncio.run(attbot_module.scan_apollo_events(limit=1))
+    assert attbot_module.event_log[0]["accepted"] == [(1, "Miller")]
+    assert logged == 1
+
+
 # --- check_member with event_key fallback ---
 def test_check_member_event_key_fallback(attbot_module):
     attbot_module.event_log.clear()
@@ -39,10 +39,10 @@ def test_log_accept(attbot_module):
     attbot_module.log_attendance(123, "Hastings", 999)
     assert len(attbot_module.attendance_log) == 1
 
-    key = "999-123"
+    key = (999, "123", "accepted")
     assert key in attbot_module.attendance_log
 
-    entry = attbot_module.attendance_log[key]   # this what the function actually builds "pseudo_id = f"{event_id}-{user_id_str}", check if that exact key exists
+    entry = attbot_module.attendance_log[key]   # this what the function actually builds "pseudo_id = (event_id, user_id_str, response)", check if that exact key exists
 
     assert entry["user_id"] == "123"    # the user_id_str = str(user_id) is being converted to string, so check for string not int
     assert entry["username"] == "Hastings"
@@ -53,7 +53,7 @@ def test_log_accept(attbot_module):
 def test_log_decline(attbot_module):
     attbot_module.log_attendance(123, "Mooses", 999, response="declined")
 
-    key = "999-123-declined"
+    key = (999, "123", "declined")
     assert key in attbot_module.attendance_log
 
     entry = attbot_module.attendance_log[key]
@@ -61,8 +61,8 @@ def test_log_decline(attbot_module):
 
 # since the function has "if pseudo_id not in attendance_log:" calling it 2x should not create 2 entries, should not overwrite and keep length = 1 keeping idempotency
 def test_no_duplicate_entries(attbot_module):
-    attbot_module.log_attendance(123, "Miller", 999)
-    attbot_module.log_attendance(123, "Miller", 999)
+    assert attbot_module.log_attendance(123, "Miller", 999) is True
+    assert attbot_module.log_attendance(123, "Miller", 999) is False
 
     assert len(attbot_module.attendance_log) == 1
 
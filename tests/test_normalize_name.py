@@ -45,3 +45,18 @@ def test_slash_preserved_for_ranks(attbot_module):
     # Ensures promoted members stay distinct after normalization
     assert attbot_module.normalize_name("MSPC/5") != attbot_module.normalize_name("MSPC/6")
 
+
+# normalize_name is cached, repeat calls for the same raw name should be served from the cache
+def test_repeat_names_hit_cache(attbot_module):
+    attbot_module.normalize_name.cache_clear()
+    attbot_module.normalize_name("Cpl. A. Miller!")
+    attbot_module.normalize_name("Cpl. A. Miller!")
+    assert attbot_module.normalize_name.cache_info().hits == 1
+
+# different raw spellings that normalize to the same name share a single interned string
+def test_equal_names_are_interned(attbot_module):
+    assert attbot_module.normalize_name("Cpl. Miller") is attbot_module.normalize_name("cpl miller!")
+
+# casefold, so unicode case variants match too
+def test_unicode_casefold(attbot_module):
+    assert attbot_module.normalize_name("STRAẞE") == attbot_module.normalize_name("strasse")
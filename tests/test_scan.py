@@ -41,7 +41,9 @@ class MockEmbed:
 # usecase
 class MockAuthor:
     def __init__(self):
+        self.id = 1
         self.name = "Apollo"
+        self.bot = True
 
 # create a mock message, give the msg_id to the method, pass in mock author object and the embed as a list of strings to make both the author and embed
 # the attribute of message
@@ -260,4 +262,114 @@ def test_scan_all_reactions_handles_missing_history_permission(attbot_module):
     asyncio.run(attbot_module.scan_all_reactions.callback(interaction, channel, 5))
 
     assert interaction.response.deferred is True
-    assert interaction.followup.messages == ["Can't read message history in #restricted."]
\ No newline at end of file
+    assert interaction.followup.messages == ["Can't read message history in #restricted."]
+
+def test_parse_embed_names_strips_dashes_and_blank_lines(attbot_module):
+    assert attbot_module.parse_embed_names("- Miller\n\n- Rydah \n-\n") == ["Miller", "Rydah"]
+
+
+def test_parse_embed_names_dashed_only_skips_plain_lines(attbot_module):
+    description = "Thursday op\r\n- Miller\nBring NVGs\n  - Rydah"
+    assert attbot_module.parse_embed_names(description, dashed_only=True) == ["Miller", "Rydah"]
+
+
+# back to back scans should reuse the cached channel history instead of hitting channel.history() again
+def test_scan_apollo_events_reuses_cached_history(monkeypatch, attbot_module):
+    calls = []
+
+    class CountingChannel(MockChannel):
+        async def history(self, limit=None, before=None):
+            calls.append((limit, before))
+            for i in range(min(limit, self.total_messages)):
+                yield MockMessage(i)
+
+    channel = CountingChannel(total_messages=5)
+    monkeypatch.setattr(attbot_module.bot, "get_channel", lambda x: channel)
+    monkeypatch.setattr(attbot_module.bot, "get_guild", lambda x: MockGuild())
+
+    asyncio.run(attbot_module.scan_apollo_events(limit=5))
+    scanned, _ = asyncio.run(attbot_module.scan_apollo_events(limit=5))
+
+    assert len(calls) == 1
+    assert scanned == 5
+    assert len(attbot_module.event_log) == 5
+
+
+# a partially cached history is topped up from before the last cached message
+def test_cached_history_continues_after_partial_cache(attbot_module):
+    calls = []
+
+    class CountingChannel(MockChannel):
+        async def history(self, limit=None, before=None):
+            calls.append(before.id if before else None)
+            start = before.id + 1 if before else 0
+            for i in range(start, min(start + limit, self.total_messages)):
+                yield MockMessage(i)
+
+    channel = CountingChannel(total_messages=6)
+
+    async def take(n):
+        out = []
+        async for msg in attbot_module.cached_history(channel, 100, key=1):
+            out.append(msg.id)
+            if len(out) >= n:
+                break
+        return out
+
+    assert asyncio.run(take(2)) == [0, 1]
+    assert asyncio.run(take(6)) == [0, 1, 2, 3, 4, 5]
+    assert calls == [None, 1]
+
+
+# two scans running at the same time must not both top up the cache, each message is only cached once
+def test_cached_history_concurrent_consumers_dont_duplicate(attbot_module):
+    calls = []
+
+    class SlowChannel(MockChannel):
+        async def history(self, limit=None, before=None):
+            calls.append(before.id if before else None)
+            start = before.id + 1 if before else 0
+            for i in range(start, min(start + limit, self.total_messages)):
+                await asyncio.sleep(0)
+                yield MockMessage(i)
+
+    channel = SlowChannel(total_messages=250)
+
+    async def consume():
+        out = []
+        async for msg in attbot_module.cached_history(channel, 1000, key=1):
+            out.append(msg.id)
+            await asyncio.sleep(0)
+        return out
+
+    async def run():
+        first, second = await asyncio.gather(consume(), consume())
+        third = await consume()
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    expected = list(range(250))
+    assert first == second == third == expected
+    assert [m.id for m in attbot_module.history_cache[1]["messages"]] == expected
+    assert calls == [None]
+
+
+def test_scan_apollo_events_stores_stripped_display_names(monkeypatch, attbot_module):
+
+    # a nickname with stray whitespace still resolves, but the pretty name stored in the event_log comes out stripped so the leaderboard
+    # and award lines can show it as is
+    attbot_module.event_log.clear()
+    attbot_module.attendance_log.clear()
+
+    guild = MockGuild()
+    guild.members[0].display_name = "  Miller "
+    guild.members[2].display_name = "Mooses "
+    monkeypatch.setattr(attbot_module.bot, "get_channel", lambda x: MockChannel())
+    monkeypatch.setattr(attbot_module.bot, "get_guild", lambda x: guild)
+
+    asyncio.run(attbot_module.scan_apollo_events(limit=1))
+
+    event = attbot_module.event_log[0]
+    assert event["accepted"] == [(1, "Miller"), (2, "Rydah")]
+    assert event["declined"] == [(3, "Mooses")]
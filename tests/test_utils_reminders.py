@@ -6,9 +6,11 @@ from datetime import datetime, timezone
 from bots.utils import (
     init_db,
     add_reminder,
+    add_reminders_bulk,
     get_reminders,
     get_user_reminders,
     delete_reminder,
+    reminder_exists,
 )
 
 
@@ -39,6 +41,10 @@ class TestAddReminder:
         # remind_time at index 4 should be UTC ISO string
         assert "+00:00" in rows[0][4] or "Z" in rows[0][4] or "UTC" in rows[0][4]
 
+    def test_add_reminder_with_z_suffix(self, db_path):
+        add_reminder(100, 200, "Zulu reminder", "2026-07-01T15:30:00Z", True, db_path)
+        assert get_user_reminders(100, db_path)[0]["remind_time"] == "2026-07-01T15:30:00+00:00"
+
     def test_add_reminder_with_past_datetime(self, db_path):
         dt = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
         rid = add_reminder(100, 200, "Past reminder", dt, False, db_path)
@@ -60,6 +66,44 @@ class TestAddReminder:
         assert rows[1][5] == 0  # dm column
 
 
+class TestAddRemindersBulk:
+    def test_bulk_adds_all_rows_in_utc(self, db_path):
+        rows = [
+            (100, 200, "first", datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc), True),
+            (100, 200, "second", "2026-06-02T14:00:00+02:00", False),
+        ]
+        assert add_reminders_bulk(rows, db_path) == 2
+
+        stored = get_user_reminders(100, db_path)
+        assert [r["message"] for r in stored] == ["first", "second"]
+        assert stored[1]["remind_time"] == "2026-06-02T12:00:00+00:00"
+        assert [r["dm"] for r in stored] == [1, 0]
+
+    def test_bulk_bad_time_adds_nothing(self, db_path):
+        rows = [
+            (100, 200, "good", datetime(2026, 6, 1, tzinfo=timezone.utc), True),
+            (100, 200, "bad", "not-a-date", True),
+        ]
+        with pytest.raises(ValueError):
+            add_reminders_bulk(rows, db_path)
+        assert get_reminders(db_path) == []
+
+    def test_bulk_failed_insert_rolls_back(self, db_path):
+        import sqlite3
+
+        rows = [
+            (100, 200, "good", datetime(2026, 6, 1, tzinfo=timezone.utc), True),
+            (100, 200, None, datetime(2026, 6, 2, tzinfo=timezone.utc), True),  # message is NOT NULL
+        ]
+        with pytest.raises(sqlite3.IntegrityError):
+            add_reminders_bulk(rows, db_path)
+        assert get_reminders(db_path) == []
+
+        # and the connection is back in autocommit afterwards
+        add_reminder(100, 200, "after", datetime(2026, 6, 3, tzinfo=timezone.utc), True, db_path)
+        assert len(get_reminders(db_path)) == 1
+
+
 class TestGetReminders:
     def test_get_reminders_empty(self, db_path):
         assert get_reminders(db_path) == []
@@ -84,6 +128,17 @@ class TestGetReminders:
         assert row[5] == 1  # dm
 
 
+    def test_get_reminders_rows_by_column_name(self, db_path):
+        dt = datetime(2026, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
+        rid = add_reminder(100, 200, "Named", dt, True, db_path)
+        row = get_reminders(db_path)[0]
+        assert row["id"] == rid
+        assert row["remind_time"] == row[4]
+        # still unpacks like a tuple
+        reminder_id, user_id, channel_id, message, remind_time, dm = row
+        assert (reminder_id, user_id, message, dm) == (rid, 100, "Named", 1)
+
+
 class TestGetUserReminders:
     def test_get_user_reminders_empty(self, db_path):
         assert get_user_reminders(999, db_path) == []
@@ -106,6 +161,28 @@ class TestGetUserReminders:
         assert row[0] == rid
 
 
+    def test_get_user_reminders_uses_user_id_index(self, db_path):
+        from bots.utils import get_connection
+
+        plan = get_connection(db_path).execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM reminders WHERE user_id = ?", (100,)
+        ).fetchall()
+        assert any("idx_reminders_user_id" in row[3] for row in plan)
+
+
+class TestReminderExists:
+    def test_reminder_exists_until_deleted(self, db_path):
+        dt = datetime(2026, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
+        rid = add_reminder(100, 200, "Still here", dt, False, db_path)
+        assert reminder_exists(rid, db_path) is True
+
+        delete_reminder(rid, 100, db_path)
+        assert reminder_exists(rid, db_path) is False
+
+    def test_reminder_exists_unknown_id(self, db_path):
+        assert reminder_exists(99999, db_path) is False
+
+
 class TestDeleteReminder:
     def test_delete_reminder_success(self, db_path):
         dt = datetime(2026, 9, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -136,3 +213,20 @@ class TestDeleteReminder:
     def test_add_reminder_non_datetime_non_string_raises(self, db_path):
         with pytest.raises(TypeError, match="remind_time must be a datetime"):
             add_reminder(100, 200, "bad", 12345, True, db_path)
+
+
+class TestConnectionReuse:
+    def test_helpers_share_one_connection_per_db(self, db_path):
+        from bots.utils import get_connection
+
+        conn = get_connection(db_path)
+        add_reminder(100, 200, "Reuse", datetime(2026, 9, 1, tzinfo=timezone.utc), False, db_path)
+        get_reminders(db_path)
+        assert get_connection(db_path) is conn
+
+    def test_connection_uses_wal(self, db_path):
+        from bots.utils import get_connection
+
+        conn = get_connection(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL